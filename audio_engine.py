@@ -9,55 +9,309 @@ import numpy as np
 import threading
 import time
 import os
+import re
+import math
+import ctypes
+import ctypes.util
+import platform
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from queue import Queue
 
+from project_manager import make_safe_filename
+
+# Numba is optional - without it the kernels below run as plain Python
+try:
+	from numba import njit, prange
+	from numba.typed import List as NumbaList
+	NUMBA_AVAILABLE = True
+except ImportError:
+	NUMBA_AVAILABLE = False
+	prange = range
+
+	def njit(*args, **kwargs):
+		"""Fallback no-op decorator used when Numba is not installed"""
+		if len(args) == 1 and callable(args[0]):
+			return args[0]
+		return lambda func: func
+
+# SciPy is optional - it only provides the vectorized compressor path
+try:
+	from scipy.signal import lfilter
+except ImportError:
+	lfilter = None
+
+def _enable_ftz_daz():
+	"""Set flush-to-zero and denormals-are-zero for the calling thread (x86 only)"""
+	if platform.machine().lower() not in ('x86_64', 'amd64'):
+		return False
+	try:
+		if os.name == 'nt':
+			# _DN_FLUSH under the _MCW_DN mask sets both FTZ and DAZ in MXCSR
+			ctypes.cdll.msvcrt._controlfp(0x01000000, 0x03000000)
+			return True
+		if platform.system() == 'Linux':
+			# glibc x86_64 fenv_t is 32 bytes with the SSE MXCSR at offset 28
+			libm = ctypes.CDLL(ctypes.util.find_library('m'))
+			env = (ctypes.c_uint8 * 32)()
+			if libm.fegetenv(ctypes.byref(env)) != 0:
+				return False
+			mxcsr = int.from_bytes(bytes(env[28:32]), 'little') | 0x8040  # FTZ | DAZ
+			env[28:32] = list(mxcsr.to_bytes(4, 'little'))
+			return libm.fesetenv(ctypes.byref(env)) == 0
+	except Exception as e:
+		print(f"Could not enable denormal flushing: {e}")
+	return False
+
+def _boost_audio_thread():
+	"""Raise the calling thread to real-time priority and, once that's granted, pin it to the last CPU (best effort)"""
+	# A pinned thread at normal priority can't move off a busy core, so pinning only follows a priority boost
+	last_cpu = (os.cpu_count() or 1) - 1
+	try:
+		if os.name == 'nt':
+			kernel32 = ctypes.windll.kernel32
+			thread = kernel32.GetCurrentThread()
+			if not kernel32.SetThreadPriority(thread, 15):  # THREAD_PRIORITY_TIME_CRITICAL
+				return False
+			if last_cpu > 0:
+				kernel32.SetThreadAffinityMask(thread, 1 << last_cpu)
+			return True
+		if hasattr(os, 'sched_setscheduler'):
+			# On Linux pid 0 means the calling thread, not the whole process
+			os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(80))
+			if last_cpu > 0:
+				try:
+					os.sched_setaffinity(0, {last_cpu})
+				except OSError:
+					pass  # Real-time priority alone still helps
+			return True
+	except (OSError, AttributeError):
+		pass  # Needs CAP_SYS_NICE / rtprio limits - keep the default scheduling
+	return False
+
+@njit(cache=True, fastmath=True)
+def _compress_sample(sample, env, threshold, ratio, attack_coeff, release_coeff, makeup_gain):
+	"""Compress one sample - returns (output, updated envelope)"""
+	# Update envelope follower (peak detector)
+	input_level = math.fabs(sample)
+	if input_level > env:
+		env += (input_level - env) * (1.0 - attack_coeff)
+	else:
+		env += (input_level - env) * (1.0 - release_coeff)
+
+	# Calculate gain reduction
+	gain = 1.0
+	if env > threshold and env > 0:
+		target_level = threshold + (env - threshold) / ratio
+		gain = target_level / env
+
+	return sample * gain * makeup_gain, env
+
+@njit(cache=True, fastmath=True)
+def _compressor_kernel(audio, envelope, threshold, ratio, attack_coeff, release_coeff, makeup_gain):
+	"""Compressor inner loop - envelope is a 1-element array carried between blocks"""
+	output = np.empty_like(audio)
+	env = envelope[0]
+
+	for i in range(audio.shape[0]):
+		output[i], env = _compress_sample(
+			audio[i], env, threshold, ratio, attack_coeff, release_coeff, makeup_gain
+		)
+
+	envelope[0] = env
+	return output, env
+
+@njit(cache=True, fastmath=True)
+def _reverb_sample(sample, buffers, tap_offsets, tap_masks, tap_delays, indices, feedbacks, dry, wet_scale):
+	"""Run one sample through every delay tap and return the dry/wet mix"""
+	wet_sum = 0.0
+
+	for t in range(tap_offsets.shape[0]):
+		write_idx = indices[t]
+
+		# Get the sample written tap_delays[t] samples ago, then write new sample with feedback
+		delayed = buffers[tap_offsets[t] + ((write_idx - tap_delays[t]) & tap_masks[t])]
+		wet_sum += delayed
+		buffers[tap_offsets[t] + write_idx] = sample + delayed * feedbacks[t]
+
+		# Advance write index - buffer lengths are powers of two
+		indices[t] = (write_idx + 1) & tap_masks[t]
+
+	# Mix dry and wet signals
+	return sample * dry + wet_sum * wet_scale
+
+@njit(cache=True, fastmath=True)
+def _reverb_kernel(audio, out, buffers, tap_offsets, tap_masks, tap_delays, indices, feedbacks, dry, wet_scale):
+	"""Multi-tap feedback delay - delay lines live back to back in one buffer"""
+	for i in range(audio.shape[0]):
+		out[i] = _reverb_sample(
+			audio[i], buffers, tap_offsets, tap_masks, tap_delays, indices, feedbacks, dry, wet_scale
+		)
+
+@njit(cache=True, fastmath=True)
+def _mix_track_kernel(track_seg, volume,
+		use_compressor, envelope, threshold, ratio, attack_coeff, release_coeff, makeup_gain,
+		use_reverb, buffers, tap_offsets, tap_masks, tap_delays, indices, feedbacks, dry, wet_scale,
+		mixed_output):
+	"""Volume, FX and mono mix for one track block in a single pass - returns the peak level"""
+	env = envelope[0]
+	peak = 0.0
+
+	for i in range(track_seg.shape[0]):
+		sample = track_seg[i] * volume
+
+		if use_compressor:
+			sample, env = _compress_sample(
+				sample, env, threshold, ratio, attack_coeff, release_coeff, makeup_gain
+			)
+		if use_reverb:
+			sample = _reverb_sample(
+				sample, buffers, tap_offsets, tap_masks, tap_delays, indices, feedbacks, dry, wet_scale
+			)
+
+		level = math.fabs(sample)
+		if level > peak:
+			peak = level
+
+		mixed_output[i] += sample
+
+	envelope[0] = env
+	return peak
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _sum_tracks_kernel(tracks, lengths, gains, mixed_output):
+	"""Sum FX-free tracks into the mono bus, parallel over cache-sized blocks of samples"""
+	block = 4096
+	n = mixed_output.shape[0]
+	for b in prange((n + block - 1) // block):
+		start = b * block
+		end = min(start + block, n)
+		# The output block stays in L1 while every track is added into it
+		for t in range(len(tracks)):
+			data = tracks[t]
+			gain = gains[t]
+			for i in range(start, min(end, lengths[t])):
+				mixed_output[i] += gain * data[i]
+
+if NUMBA_AVAILABLE:
+	@njit(cache=True, fastmath=True)
+	def _peak_abs(x):
+		"""Peak absolute value in one pass, without an intermediate abs array"""
+		m = 0.0
+		for i in range(x.shape[0]):
+			a = abs(x[i])
+			if a > m:
+				m = a
+		return m
+else:
+	def _peak_abs(x):
+		"""Peak absolute value - NumPy fallback, max/min reductions avoid an abs() temporary"""
+		return max(float(x.max()), -float(x.min())) if x.size else 0.0
+
+if NUMBA_AVAILABLE:
+	@njit(cache=True, fastmath=True, boundscheck=False)
+	def _rms_envelope(x, out):
+		"""RMS of len(out) equal buckets of x in one streaming pass - reads int16 or float storage directly"""
+		step = x.shape[0] // out.shape[0]
+		for i in range(out.shape[0]):
+			base = i * step
+			s = 0.0
+			for j in range(step):
+				v = float(x[base + j])
+				s += v * v
+			out[i] = math.sqrt(s / step)
+else:
+	def _rms_envelope(x, out):
+		"""RMS of len(out) equal buckets of x - NumPy fallback, one einsum over the bucket rows"""
+		step = x.shape[0] // out.shape[0]
+		buckets = x[:out.shape[0] * step].reshape(out.shape[0], step)
+		if buckets.dtype.kind != 'f':
+			buckets = buckets.astype(np.float32)
+		np.sqrt(np.einsum('ij,ij->i', buckets, buckets) / step, out=out)
+
+@njit(cache=True, fastmath=True)
+def _update_level(levels, peaks, hold_times, track_num, new_level, current_time, hold_duration):
+	"""Max-hold level and peak latch for one track"""
+	# Use max of current and new for better visualization
+	if new_level > levels[track_num]:
+		levels[track_num] = new_level
+
+	# Peak detection - latch at full scale, release after the hold time
+	if new_level >= 1.0:
+		peaks[track_num] = True
+		hold_times[track_num] = current_time
+	elif current_time - hold_times[track_num] > hold_duration:
+		peaks[track_num] = False
+
+# Compile the kernels now so the first audio callback doesn't pay for it
+_compressor_kernel(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32), 0.8, 10.0, 0.5, 0.5, 1.0)
+_reverb_kernel(
+	np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32),
+	np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+	np.zeros(1, dtype=np.float32), 0.5, 0.1
+)
+_peak_abs(np.zeros(1, dtype=np.float32))
+_update_level(
+	np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.bool_), np.zeros(1, dtype=np.float64),
+	0, 0.0, 0.0, 1.0
+)
+_peak_abs(np.zeros((1, 2), dtype=np.float32)[:, 0])  # Strided input channel view
+
 class SimpleCompressor:
 	"""Simple peak-limiting compressor with proper gain reduction"""
 	def __init__(self, threshold=0.8, ratio=10.0, attack_ms=5.0, release_ms=50.0, sample_rate=44100):
 		self.threshold = threshold
 		self.ratio = ratio
+		self.attack_ms = attack_ms
+		self.release_ms = release_ms
 		self.attack_coeff = np.exp(-1.0 / (attack_ms * 0.001 * sample_rate))
 		self.release_coeff = np.exp(-1.0 / (release_ms * 0.001 * sample_rate))
-		self.envelope = 0.0
-		
+		self.envelope = np.zeros(1, dtype=np.float32)
+
+		# Makeup gain compensates for level loss - constant for the compressor's lifetime
+		self.makeup_gain = 1.0 + (1.0 - 1.0/self.ratio) * self.threshold
+
+		# With equal attack and release the envelope is a plain one-pole filter
+		self.use_vectorized = attack_ms == release_ms and lfilter is not None
+
+		# Envelope filter coefficients and state, designed once rather than per block
+		self.env_b = np.array([1.0 - self.attack_coeff])
+		self.env_a = np.array([1.0, -self.attack_coeff])
+		self.env_zi = np.zeros(1)
+
 	def process(self, audio):
 		"""Process audio through compressor"""
 		if len(audio) == 0:
 			return audio
-			
-		output = np.zeros_like(audio)
-		
-		for i in range(len(audio)):
-			# Get input level (absolute value)
-			input_level = abs(audio[i])
-			
-			# Update envelope follower (peak detector)
-			target_envelope = input_level
-			if target_envelope > self.envelope:
-				self.envelope += (target_envelope - self.envelope) * (1.0 - self.attack_coeff)
-			else:
-				self.envelope += (target_envelope - self.envelope) * (1.0 - self.release_coeff)
-			
-			# Calculate gain reduction
-			gain = 1.0  # Default no reduction
-			if self.envelope > self.threshold:
-				# Amount over threshold
-				over_amount = self.envelope - self.threshold
-				# Compressed amount
-				compressed_amount = over_amount / self.ratio
-				# Target output level
-				target_level = self.threshold + compressed_amount
-				# Gain needed to achieve target
-				if self.envelope > 0:
-					gain = target_level / self.envelope
-			
-			# Apply gain with makeup gain (compensate for level loss)
-			makeup_gain = 1.0 + (1.0 - 1.0/self.ratio) * (self.threshold / 1.0)
-			output[i] = audio[i] * gain * makeup_gain
-		
+
+		if self.use_vectorized:
+			return self.process_vectorized(audio)
+
+		output, _ = _compressor_kernel(
+			audio, self.envelope, self.threshold, self.ratio,
+			self.attack_coeff, self.release_coeff, self.makeup_gain
+		)
 		return output
 
+	def process_vectorized(self, audio):
+		"""Process audio with a one-pole lfilter envelope (exact when attack == release)"""
+		if len(audio) == 0:
+			return audio
+
+		# One-pole low-pass over |audio|, seeded from the previous block's envelope
+		self.env_zi[0] = self.attack_coeff * self.envelope[0]
+		envelope, _ = lfilter(self.env_b, self.env_a, np.abs(audio), zi=self.env_zi)
+		self.envelope[0] = envelope[-1]
+
+		# Gain needed to bring the envelope down to the compressed target level
+		over = np.maximum(envelope - self.threshold, 0.0)
+		target = self.threshold + over / self.ratio
+		gain = np.where(envelope > self.threshold, target / np.maximum(envelope, 1e-12), 1.0)
+
+		return (audio * gain * self.makeup_gain).astype(audio.dtype, copy=False)
+
 class SimpleReverb:
 	"""Simple delay-based reverb"""
 	def __init__(self, room_size=0.7, damping=0.5, wet=0.3, sample_rate=44100):
@@ -73,56 +327,160 @@ class SimpleReverb:
 			self.wet = 0.5
 		
 		self.dry = 1.0 - self.wet
-		
-		# Create delay lines
-		self.delay_lines = []
+		self.wet_scale = self.wet * 0.25  # Scale down wet sum
+
+		# Create delay lines - all taps share one contiguous buffer
 		self.feedback_gains = [0.7, 0.6, 0.5, 0.4]
-		
+
+		tap_delays = []
+		tap_lengths = []
+		feedbacks = []
 		for delay_time, fb_gain in zip(delay_times, self.feedback_gains):
+			# The buffer rounds up to a power of two so indices wrap with a bitmask - the delay stays exact
 			delay_samples = int(delay_time * sample_rate)
-			self.delay_lines.append({
-				'buffer': np.zeros(delay_samples),
-				'index': 0,
-				'feedback': fb_gain * (1.0 - damping)
-			})
-	
+			tap_delays.append(delay_samples)
+			tap_lengths.append(1 << (delay_samples - 1).bit_length())
+			feedbacks.append(fb_gain * (1.0 - damping))
+
+		self.tap_delays = np.array(tap_delays, dtype=np.int64)
+		self.tap_lengths = np.array(tap_lengths, dtype=np.int64)
+		self.tap_masks = self.tap_lengths - 1
+		self.tap_offsets = np.concatenate(([0], np.cumsum(self.tap_lengths)[:-1])).astype(np.int64)
+		self.indices = np.zeros(len(tap_lengths), dtype=np.int64)
+		self.feedbacks = np.array(feedbacks, dtype=np.float32)
+		self.buffers = np.zeros(int(self.tap_lengths.sum()), dtype=np.float32)
+
 	def process(self, audio):
 		"""Process audio through reverb"""
 		if len(audio) == 0:
 			return audio
-			
-		output = np.zeros_like(audio)
-		
-		for i in range(len(audio)):
-			wet_sum = 0.0
-			
-			# Process each delay line
-			for delay_line in self.delay_lines:
-				buffer = delay_line['buffer']
-				idx = delay_line['index']
-				feedback = delay_line['feedback']
-				
-				# Get delayed sample
-				delayed = buffer[idx]
-				wet_sum += delayed
-				
-				# Write new sample with feedback
-				buffer[idx] = audio[i] + delayed * feedback
-				
-				# Advance delay line index
-				delay_line['index'] = (idx + 1) % len(buffer)
-			
-			# Mix dry and wet signals
-			output[i] = audio[i] * self.dry + wet_sum * self.wet * 0.25  # Scale down wet sum
-		
+
+		output = np.empty_like(audio)
+		_reverb_kernel(
+			audio, output, self.buffers, self.tap_offsets, self.tap_masks, self.tap_delays,
+			self.indices, self.feedbacks, self.dry, self.wet_scale
+		)
 		return output
 
+class SPSCFloatRing:
+	"""Lock-free single-producer/single-consumer float32 ring buffer"""
+	def __init__(self, size_bits=20):
+		self.size = 1 << size_bits
+		self.mask = self.size - 1
+		self.buffer = np.zeros(self.size, dtype=np.float32)
+		# Monotonic counters - only the producer moves head, only the consumer moves tail
+		self._head = ctypes.c_uint64(0)
+		self._tail = ctypes.c_uint64(0)
+		self.dropped = 0
+
+	def available(self):
+		"""Number of samples ready to be read"""
+		return self._head.value - self._tail.value
+
+	def write(self, view):
+		"""Producer only - copy as much of view as fits, never blocks"""
+		head = self._head.value
+		n = min(len(view), self.size - (head - self._tail.value))
+		if n < len(view):
+			self.dropped += len(view) - n
+
+		start = head & self.mask
+		first = min(n, self.size - start)
+		self.buffer[start:start + first] = view[:first]
+		self.buffer[:n - first] = view[first:n]
+
+		# Publish only after the samples are in place
+		self._head.value = head + n
+		return n
+
+	def read_into(self, dest):
+		"""Consumer only - copy up to len(dest) samples into dest"""
+		tail = self._tail.value
+		n = min(len(dest), self._head.value - tail)
+
+		start = tail & self.mask
+		first = min(n, self.size - start)
+		dest[:first] = self.buffer[start:start + first]
+		dest[first:n] = self.buffer[:n - first]
+
+		self._tail.value = tail + n
+		return n
+
+	def reset(self):
+		"""Discard unread samples - only call while the producer is idle"""
+		self._tail.value = self._head.value
+		self.dropped = 0
+
+def _fx_kernel_state(processors):
+	"""Flatten a track's FX processors into _mix_track_kernel arguments"""
+	compressor = processors.get('compressor')
+	reverb = processors.get('reverb')
+
+	if compressor is not None:
+		compressor_args = (
+			True, compressor.envelope, float(compressor.threshold), float(compressor.ratio),
+			float(compressor.attack_coeff), float(compressor.release_coeff), float(compressor.makeup_gain)
+		)
+	else:
+		compressor_args = (False, np.zeros(1, dtype=np.float32), 0.0, 1.0, 0.0, 0.0, 1.0)
+
+	# Processors share their state arrays with the kernel, so either path can run next block
+	if reverb is not None:
+		reverb_args = (
+			True, reverb.buffers, reverb.tap_offsets, reverb.tap_masks, reverb.tap_delays,
+			reverb.indices, reverb.feedbacks, float(reverb.dry), float(reverb.wet_scale)
+		)
+	else:
+		reverb_args = (
+			False, np.zeros(1, dtype=np.float32), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64),
+			np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32), 1.0, 0.0
+		)
+
+	return compressor_args + reverb_args
+
+for _track_dtype in (np.int16, np.float32):
+	_mix_track_kernel(
+		np.zeros(1, dtype=_track_dtype), 1.0, *_fx_kernel_state({}), np.zeros(1, dtype=np.float32)
+	)
+
+def _dedup_sorted_devices(devices):
+	"""Sort devices Sound Mapper first then by name, keeping the first device per name"""
+	ordered = sorted(devices, key=lambda d: (0 if 'microsoft sound mapper' in d['name'].lower() else 1, d['name']))
+	# Same-name devices are adjacent, so building the dict backwards lets the first one win
+	return list({d['name']: d for d in reversed(ordered)}.values())[::-1]
+
+# Full-scale value for int16 track storage
+INT16_SCALE = 32768.0
+
+def _track_scale(track_data):
+	"""Gain that maps stored track samples back to float full scale"""
+	return 1.0 / INT16_SCALE if track_data.dtype == np.int16 else 1.0
+
+def _downmix_to_mono(audio_data):
+	"""Average the channels of a (frames, channels) array, staying in float32"""
+	channels = audio_data.shape[1]
+	if channels == 2:
+		mono = audio_data[:, 0] + audio_data[:, 1]
+	else:
+		mono = audio_data.sum(axis=1, dtype=np.float32)
+	mono *= np.float32(1.0 / channels)
+	return mono
+
+def _mask_tracks(mask):
+	"""Track numbers whose bits are set in an active-track bitmask"""
+	return tuple(n for n in range(1, 9) if mask >> n & 1)
+
+# Numeric FX ids mirrored into AudioEngine.track_fx_ids for the audio callback
+FX_TYPE_IDS = {"none": 0, "wide_hall": 1, "studio": 2, "compressor": 3}
+
 class AudioEngine:
 	def __init__(self):
 		self.sample_rate = 44100
 		self.channels = 1  # Mono input
 		self.dtype = np.float32
 		self.buffer_size = 256  # Reduced from 1024 for lower latency
+		self._mixed_output = np.zeros(self.buffer_size, dtype=self.dtype)  # Mono mix, reused every callback
+		self._cb_scratch = np.zeros(self.buffer_size, dtype=self.dtype)  # Per-track/click scratch for the callback
 		
 		# Device selection
 		self.input_device = None
@@ -132,54 +490,66 @@ class AudioEngine:
 		
 		# Track manager reference (will be set externally)
 		self.track_manager = None
+		self._playable_version = None  # (track_manager._state_version, _active_mask) the cache was built from
+		self._playable_cache = ()
 		
 		# Project-specific recordings directory
 		self.recordings_dir = Path("recordings") / "Default Project"
 		
-		# Recording state
-		self.is_recording = False
+		# Recording state - is_recording is backed by an Event so the callback reads it lock-free
+		self._recording = threading.Event()
 		self.recording_track = None
-		self.recording_buffer = []
-		self.recording_lock = threading.Lock()
-		
-		# Playback state
-		self.is_playing = False
+		self._rec_buf = np.empty(self.sample_rate * 60, dtype=np.float32)  # Reused across takes, grows geometrically
+		self._rec_write = 0
+		self.recording_lock = threading.Lock()  # Never taken in the audio callback
+		
+		# Callback pushes input into the ring, a worker thread drains it into _rec_buf
+		self._rec_ring = SPSCFloatRing()
+		self._rec_worker = None
+		self._rec_worker_running = False
+		
+		# Playback state - is_playing is backed by an Event, the lock only guards transitions
+		self._playing = threading.Event()
+		self._playback_generation = 0
 		self.playback_position = 0
 		self.playback_start_time = 0
 		self.playback_lock = threading.Lock()
 		
-		# Track data storage
-		self.track_data = {}  # {track_num: numpy array}
-		self.track_lengths = {}  # {track_num: length in samples}
+		self._track_file_scan_cache = {}  # {(dir, project): (dir mtime, {track_num: newest file})}
 		
-		# Track volume and FX settings
-		self.track_volumes = {}  # {track_num: volume (0.0-1.0)}
+		# Track data storage - slots are indexed by track number (slot 0 unused)
+		self.track_data = [None] * 9  # numpy array in track_storage_dtype, or None
+		self.track_storage_dtype = np.int16  # int16 halves playback memory traffic - np.float32 for mastering
+		self.track_lengths = np.zeros(9, dtype=np.int64)  # Length in samples
+		self._active_mask = 0  # Bit n set when track n holds audio
+		self.track_data_versions = [0] * 9  # Bumped whenever a track's audio is replaced or cleared
+		self.ui_queue = Queue()  # (kind, payload) events for the UI thread - drained by the UI's tick
+		
+		# Track volume and FX settings - arrays are indexed by track number (slot 0 unused)
+		self.track_volumes_arr = np.full(9, 0.75, dtype=np.float32)  # Volume (0.0-1.0), default 75%
 		self.track_fx = {}       # {track_num: fx_type}
+		self.track_fx_ids = np.zeros(9, dtype=np.int8)  # FX_TYPE_IDS value per track
 		self.fx_processors = {}  # {track_num: {'compressor': obj, 'reverb': obj}}
+		self.fx_kernel_state = {}  # {track_num: _mix_track_kernel FX arguments}
 		
 		# Initialize track settings
 		for i in range(1, 9):
-			self.track_volumes[i] = 0.75  # Default 75%
 			self.track_fx[i] = "none"
 			self.fx_processors[i] = {}
+			self.fx_kernel_state[i] = _fx_kernel_state({})
 		
-		# Volume monitoring with decay for better visualization
-		self.track_levels = {}  # {track_num: current level}
-		self.track_peaks = {}   # {track_num: peak detected}
+		# Volume monitoring with decay for better visualization (indexed by track number)
+		self.track_levels_arr = np.zeros(9, dtype=np.float32)  # Current level
+		self.track_peaks_arr = np.zeros(9, dtype=np.bool_)     # Peak detected
 		self.level_decay = 0.85  # Faster decay for more responsive meters
-		self.peak_hold_time = {}  # {track_num: time when peak was detected}
+		self.peak_hold_time_arr = np.zeros(9, dtype=np.float64)  # Time when peak was detected
 		self.peak_hold_duration = 1.0  # Hold peak indicator for 1 second
 		
 		# Latency compensation
 		self.measured_latency_samples = 0
 		self.measured_latency_ms = 0.0
 		self.latency_calibrated = False
-		
-		# Initialize all tracks to zero levels
-		for i in range(1, 9):
-			self.track_levels[i] = 0.0
-			self.track_peaks[i] = False
-			self.peak_hold_time[i] = 0.0
+		self._click_rfft = None  # (fft_len, conjugated click spectrum) cached during calibration
 		
 		# Audio stream
 		self.stream = None
@@ -192,6 +562,7 @@ class AudioEngine:
 		self.samples_per_beat = 0
 		self.metronome_sound = None
 		self.metronome_and_sound = None  # For "and" beats (every 4th)
+		self._metronome_bank = None  # Row 0 = regular click, row 1 = "and" click
 		self.current_beat_in_measure = 1  # Track which beat in 4/4 time
 		
 		self.initialize_devices()
@@ -201,9 +572,14 @@ class AudioEngine:
 
 		self.master_volume_gain = 1.0  # Default 0 dB (75% slider position)
 		
+		# Decaying reverb/compressor tails produce denormals - the audio callback flushes them to
+		# zero on its own thread only, leaving the Tk thread's floating-point behaviour alone
+		self._callback_thread_ready = False
+		
 	def set_track_manager(self, track_manager):
 		"""Set track manager reference for mute/solo functionality"""
 		self.track_manager = track_manager
+		self._playable_version = None
 		track_manager._audio_engine_ref = self
 
 	def set_master_volume(self, linear_gain):
@@ -212,15 +588,18 @@ class AudioEngine:
 		
 	def set_track_volume(self, track_num, volume):
 		"""Set volume for a track (0.0 to 1.0)"""
-		self.track_volumes[track_num] = max(0.0, min(1.0, volume))
+		self.track_volumes_arr[track_num] = max(0.0, min(1.0, volume))
 		
 	def get_track_volume(self, track_num):
 		"""Get volume for a track"""
-		return self.track_volumes.get(track_num, 0.75)
+		if 0 < track_num < len(self.track_volumes_arr):
+			return float(self.track_volumes_arr[track_num])
+		return 0.75
 		
 	def set_track_fx(self, track_num, fx_type):
 		"""Set FX type for a track"""
 		self.track_fx[track_num] = fx_type
+		self.track_fx_ids[track_num] = FX_TYPE_IDS.get(fx_type, 0)
 		
 		# Initialize FX processors based on type
 		if fx_type == "wide_hall":
@@ -240,16 +619,32 @@ class AudioEngine:
 		else:  # "none"
 			self.fx_processors[track_num] = {}
 			
+		self.fx_kernel_state[track_num] = _fx_kernel_state(self.fx_processors[track_num])
+		
 	def get_track_fx(self, track_num):
 		"""Get current FX type for a track"""
 		return self.track_fx.get(track_num, "none")
 		
+	def snapshot_track_params(self):
+		"""Data presence, FX type and volume of every track in one call - {track_num: dict}"""
+		volumes = self.track_volumes_arr.tolist()
+		active_mask = self._active_mask
+		return {
+			track_num: {
+				'has_data': bool(active_mask >> track_num & 1),
+				'fx_type': self.track_fx.get(track_num, "none"),
+				'track_volume': volumes[track_num]
+			}
+			for track_num in range(1, 9)
+		}
+		
 	def process_track_fx(self, track_num, audio_data):
 		"""Process audio through track FX chain"""
 		if track_num not in self.fx_processors or not self.fx_processors[track_num]:
 			return audio_data
 	
-		processed = audio_data.copy()
+		# Processors never modify their input, so no defensive copy is needed
+		processed = audio_data
 		processors = self.fx_processors[track_num]
 	
 		# Apply compression first
@@ -343,7 +738,7 @@ class AudioEngine:
 				progress.pack(pady=15)
 				progress.start()
 			
-				popup.update()
+				popup.update_idletasks()
 				return popup, progress
 			
 			except Exception as e:
@@ -381,6 +776,7 @@ class AudioEngine:
 				self.measured_latency_samples = self.buffer_size * 3
 				self.measured_latency_ms = (self.measured_latency_samples / self.sample_rate) * 1000
 				print(f"Using estimated latency: {self.measured_latency_ms:.1f}ms")
+				self.publish_latency_info()
 			
 				if popup:
 					popup.after(0, lambda: popup.destroy())
@@ -394,24 +790,32 @@ class AudioEngine:
 			print("Measuring system latency with 10 samples...")
 			latency_measurements = []
 			
+			# Generate a test click - identical for every measurement
+			click_duration = 0.05  # 50ms click
+			click_samples = int(self.sample_rate * click_duration)
+			test_click = np.arange(click_samples, dtype=np.float32)
+			test_click *= np.float32(2 * np.pi * 1000 / self.sample_rate)  # 1kHz phase per sample
+			np.sin(test_click, out=test_click)
+			test_click *= np.float32(0.5)
+			self._click_rfft = None
+			
 			for measurement_num in range(4):
 				print(f"Taking measurement {measurement_num + 1}/4...")
 				
-				# Generate a test click
-				click_duration = 0.05  # 50ms click
-				click_samples = int(self.sample_rate * click_duration)
-				test_click = np.sin(2 * np.pi * 1000 * np.linspace(0, click_duration, click_samples)) * 0.5
-				
-				# Recording variables
-				recorded_data = []
+				# Recording variables - preallocated with headroom for stream start-up
+				test_duration = 0.5  # 500ms should be enough
+				recorded_data = np.empty(int(self.sample_rate * test_duration * 1.5), dtype=np.float32)
+				write_idx = 0
 				click_played = False
 				
 				def latency_callback(indata, outdata, frames, time_info, status):
-					nonlocal click_played
-					recorded_data.extend(indata.flatten())
+					nonlocal click_played, write_idx
+					n = min(frames, len(recorded_data) - write_idx)
+					recorded_data[write_idx:write_idx + n] = indata[:n, 0]
+					write_idx += n
 					
 					# Play the click once at the beginning
-					if not click_played and len(recorded_data) < frames * 2:
+					if not click_played and write_idx < frames * 2:
 						click_start = 0
 						click_end = min(frames, len(test_click))
 						outdata[:click_end, 0] = test_click[click_start:click_end]
@@ -422,7 +826,6 @@ class AudioEngine:
 						outdata.fill(0)
 				
 				# Record for analysis
-				test_duration = 0.5  # 500ms should be enough
 				with sd.Stream(
 					samplerate=self.sample_rate,
 					device=(self.input_device, self.output_device),
@@ -434,14 +837,14 @@ class AudioEngine:
 					sd.sleep(int(test_duration * 1000))
 				
 				# Analyze recorded data
-				if len(recorded_data) < click_samples:
+				if write_idx < click_samples:
 					print(f"Measurement {measurement_num + 1} failed: insufficient data")
 					continue
 					
-				recorded_array = np.array(recorded_data)
+				recorded_array = recorded_data[:write_idx]
 				
 				# Find the click in recorded data using cross-correlation
-				correlation = np.correlate(recorded_array, test_click, mode='full')
+				correlation = self.correlate_with_click(recorded_array, test_click)
 				peak_index = np.argmax(correlation)
 				
 				# Calculate latency - account for correlation offset
@@ -471,6 +874,7 @@ class AudioEngine:
 				self.measured_latency_samples = average_latency_samples
 				self.measured_latency_ms = (average_latency_samples / self.sample_rate) * 1000
 				self.latency_calibrated = True
+				self.publish_latency_info()
 	
 				print(f"✓ Average latency from {len(latency_measurements)} measurements:")
 				print(f"  {self.measured_latency_ms:.1f}ms ± {(std_deviation/self.sample_rate)*1000:.1f}ms")
@@ -486,8 +890,26 @@ class AudioEngine:
 			self.measured_latency_samples = self.buffer_size * 4
 			self.measured_latency_ms = (self.measured_latency_samples / self.sample_rate) * 1000
 			print(f"Using conservative estimate: {self.measured_latency_ms:.1f}ms")
+			self.publish_latency_info()
 			return self.measured_latency_samples
 			
+	def correlate_with_click(self, recorded_array, test_click):
+		"""FFT cross-correlation, same output as np.correlate(recorded, click, mode='full')"""
+		num_recorded = len(recorded_array)
+		num_click = len(test_click)
+		
+		# Zero-pad to a power of two so the circular correlation doesn't wrap
+		fft_len = 1 << (num_recorded + num_click - 2).bit_length()
+		
+		# The click spectrum is reused across measurements with the same FFT size
+		if self._click_rfft is None or self._click_rfft[0] != fft_len:
+			self._click_rfft = (fft_len, np.conj(np.fft.rfft(test_click, n=fft_len)))
+		
+		circular = np.fft.irfft(np.fft.rfft(recorded_array, n=fft_len) * self._click_rfft[1], n=fft_len)
+		
+		# Negative lags sit at the end of the circular result - move them to the front
+		return np.concatenate((circular[fft_len - (num_click - 1):], circular[:num_recorded]))
+		
 	def initialize_devices(self):
 		"""Initialize and catalog available audio devices with Sound Mapper defaults"""
 		try:
@@ -532,17 +954,8 @@ class AudioEngine:
 			self.output_device = sound_mapper_output if sound_mapper_output is not None else sd.default.device[1]
 			
 			# Sort and deduplicate device lists
-			seen_input_names = set()
-			for device in sorted(input_devices, key=lambda x: (0 if 'microsoft sound mapper' in x['name'].lower() else 1, x['name'])):
-				if device['name'] not in seen_input_names:
-					self.available_input_devices.append(device)
-					seen_input_names.add(device['name'])
-
-			seen_output_names = set()
-			for device in sorted(output_devices, key=lambda x: (0 if 'microsoft sound mapper' in x['name'].lower() else 1, x['name'])):
-				if device['name'] not in seen_output_names:
-					self.available_output_devices.append(device)
-					seen_output_names.add(device['name'])			
+			self.available_input_devices = _dedup_sorted_devices(input_devices)
+			self.available_output_devices = _dedup_sorted_devices(output_devices)
 
 			print(f"Default input: {sd.query_devices(self.input_device)['name']}")
 			print(f"Default output: {sd.query_devices(self.output_device)['name']}")
@@ -605,40 +1018,7 @@ class AudioEngine:
 			cowbell_file = get_resource_path("cowbell.mp3")
 			if os.path.exists(cowbell_file):  # Use os.path.exists() instead of .exists()
 				print("Loading cowbell.mp3...")
-				audio_data, sample_rate = sf.read(cowbell_file)  # No need for str() conversion
-				
-				# Resample if needed
-				if sample_rate != self.sample_rate:
-					try:
-						from scipy import signal
-						num_samples = int(len(audio_data) * self.sample_rate / sample_rate)
-						audio_data = signal.resample(audio_data, num_samples)
-					except ImportError:
-						# Fallback: simple linear interpolation
-						ratio = self.sample_rate / sample_rate
-						new_length = int(len(audio_data) * ratio)
-						audio_data = np.interp(
-							np.linspace(0, len(audio_data)-1, new_length),
-							np.arange(len(audio_data)),
-							audio_data
-						)
-				
-				# Convert to mono if stereo
-				if len(audio_data.shape) > 1:
-					audio_data = np.mean(audio_data, axis=1)
-				
-				# Normalize and limit duration to 200ms max
-				max_samples = int(0.2 * self.sample_rate)
-				if len(audio_data) > max_samples:
-					audio_data = audio_data[:max_samples]
-					
-				# Apply fade out to avoid clicks
-				fade_samples = int(0.01 * self.sample_rate)  # 10ms fade
-				if len(audio_data) > fade_samples:
-					fade_curve = np.linspace(1, 0, fade_samples)
-					audio_data[-fade_samples:] *= fade_curve
-				
-				self.metronome_sound = audio_data.astype(self.dtype)
+				self.metronome_sound = self.load_metronome_sample(cowbell_file)
 				print("✓ Loaded cowbell.mp3 for metronome")
 			else:
 				raise Exception("cowbell.mp3 not found")
@@ -662,40 +1042,7 @@ class AudioEngine:
 			and1_file = get_resource_path("and1.mp3")
 			if os.path.exists(and1_file):  # Use os.path.exists() instead of .exists()
 				print("Loading and1.mp3...")
-				audio_data, sample_rate = sf.read(and1_file)  # No need for str() conversion
-				
-				# Resample if needed
-				if sample_rate != self.sample_rate:
-					try:
-						from scipy import signal
-						num_samples = int(len(audio_data) * self.sample_rate / sample_rate)
-						audio_data = signal.resample(audio_data, num_samples)
-					except ImportError:
-						# Fallback: simple linear interpolation
-						ratio = self.sample_rate / sample_rate
-						new_length = int(len(audio_data) * ratio)
-						audio_data = np.interp(
-							np.linspace(0, len(audio_data)-1, new_length),
-							np.arange(len(audio_data)),
-							audio_data
-						)
-				
-				# Convert to mono if stereo
-				if len(audio_data.shape) > 1:
-					audio_data = np.mean(audio_data, axis=1)
-				
-				# Normalize and limit duration to 200ms max
-				max_samples = int(0.2 * self.sample_rate)
-				if len(audio_data) > max_samples:
-					audio_data = audio_data[:max_samples]
-					
-				# Apply fade out to avoid clicks
-				fade_samples = int(0.01 * self.sample_rate)  # 10ms fade
-				if len(audio_data) > fade_samples:
-					fade_curve = np.linspace(1, 0, fade_samples)
-					audio_data[-fade_samples:] *= fade_curve
-				
-				self.metronome_and_sound = audio_data.astype(self.dtype)
+				self.metronome_and_sound = self.load_metronome_sample(and1_file)
 				print("✓ Loaded and1.mp3 for metronome 'and' beats")
 			else:
 				# Use the same sound for "and" beats if and1.mp3 not found
@@ -708,7 +1055,82 @@ class AudioEngine:
 			if self.metronome_sound is not None:
 				self.metronome_and_sound = self.metronome_sound.copy()
 				print("✓ Using main metronome sound for 'and' beats")
+		
+		assert self.metronome_sound.flags['C_CONTIGUOUS']
+		
+		# Stack both clicks, zero-padded to a common length, so beats just pick a row
+		and_sound = self.metronome_and_sound if self.metronome_and_sound is not None else self.metronome_sound
+		bank_length = max(len(self.metronome_sound), len(and_sound))
+		self._metronome_bank = np.zeros((2, bank_length), dtype=np.float32)
+		self._metronome_bank[0, :len(self.metronome_sound)] = self.metronome_sound
+		self._metronome_bank[1, :len(and_sound)] = and_sound
+			
+	def load_metronome_sample(self, file_path):
+		"""Load a metronome sample as mono at the engine rate, trimmed and faded - cached on disk"""
+		source = Path(file_path)
+		cache_dir = Path.home() / ".cache" / "clifs8track"
+		cache_prefix = f"{source.stem}_{self.sample_rate}_"
+		cache_file = cache_dir / f"{cache_prefix}{source.stat().st_mtime_ns}.npy"
+		
+		# Reuse the processed sample if the source file hasn't changed
+		if cache_file.exists():
+			try:
+				return np.load(cache_file)
+			except Exception as e:
+				print(f"Ignoring unreadable metronome cache {cache_file}: {e}")
+		
+		audio_data, sample_rate = sf.read(str(source), dtype='float32')
+		
+		# Convert to mono if stereo
+		if len(audio_data.shape) > 1:
+			audio_data = _downmix_to_mono(audio_data)
+		
+		# Resample if needed
+		if sample_rate != self.sample_rate:
+			audio_data = self.resample_audio(audio_data, sample_rate)
+		
+		# Normalize and limit duration to 200ms max
+		max_samples = int(0.2 * self.sample_rate)
+		if len(audio_data) > max_samples:
+			audio_data = audio_data[:max_samples]
 			
+		# Apply fade out to avoid clicks
+		fade_samples = int(0.01 * self.sample_rate)  # 10ms fade
+		if len(audio_data) > fade_samples:
+			fade_curve = np.linspace(1, 0, fade_samples)
+			audio_data[-fade_samples:] *= fade_curve
+		
+		# No copy when the processed sample is already contiguous float32
+		audio_data = np.ascontiguousarray(audio_data, dtype=self.dtype)
+		
+		# Replace any stale cache entries for this sample
+		try:
+			cache_dir.mkdir(parents=True, exist_ok=True)
+			for stale_file in cache_dir.glob(f"{cache_prefix}*.npy"):
+				stale_file.unlink()
+			np.save(cache_file, audio_data)
+		except Exception as e:
+			print(f"Could not cache metronome sample: {e}")
+		
+		return audio_data
+		
+	def resample_audio(self, audio_data, sample_rate):
+		"""Resample mono audio to the engine rate with a polyphase filter"""
+		try:
+			from scipy import signal
+			g = math.gcd(int(self.sample_rate), int(sample_rate))
+			audio_data = signal.resample_poly(audio_data, self.sample_rate // g, int(sample_rate) // g)
+		except ImportError:
+			# Fallback: simple linear interpolation
+			ratio = self.sample_rate / sample_rate
+			new_length = int(len(audio_data) * ratio)
+			audio_data = np.interp(
+				np.linspace(0, len(audio_data)-1, new_length),
+				np.arange(len(audio_data)),
+				audio_data
+			)
+		return audio_data.astype(self.dtype, copy=False)
+		
 	def calculate_metronome_timing(self):
 		"""Calculate samples per beat based on BPM"""
 		if self.bpm > 0:
@@ -726,6 +1148,28 @@ class AudioEngine:
 		"""Set metronome volume (0.0 to 1.0) with 12 dB boost at 100%"""
 		self.metronome_volume = max(0.0, min(1.0, volume))
 		
+	@property
+	def is_playing(self):
+		return self._playing.is_set()
+		
+	@is_playing.setter
+	def is_playing(self, value):
+		if value:
+			self._playing.set()
+		else:
+			self._playing.clear()
+			
+	@property
+	def is_recording(self):
+		return self._recording.is_set()
+		
+	@is_recording.setter
+	def is_recording(self, value):
+		if value:
+			self._recording.set()
+		else:
+			self._recording.clear()
+			
 	def get_effective_metronome_volume(self):
 		"""Get effective metronome volume with 12 dB boost (4x gain) at 100%"""
 		if self.metronome_volume == 0:
@@ -738,23 +1182,25 @@ class AudioEngine:
 		if status:
 			print(f"Audio callback status: {status}")
 			
+		if not self._callback_thread_ready:
+			# One-time setup of the audio thread: denormal flushing and real-time scheduling
+			_enable_ftz_daz()
+			_boost_audio_thread()
+			self._callback_thread_ready = True
+			
 		# Initialize output - use fill for better performance
 		outdata.fill(0)
 		
 		# Handle recording with minimal processing
-		if self.is_recording and self.recording_track is not None:
-			with self.recording_lock:
-				# Convert input to mono if needed - optimized
-				mono_input = indata[:, 0] if indata.shape[1] > 1 else indata.flatten()
-				self.recording_buffer.extend(mono_input)
-				
-				# Quick level calculation for recording track - apply volume for level display
-				input_level = np.max(np.abs(mono_input))
-				self.track_levels[self.recording_track] = max(
-					self.track_levels[self.recording_track] * 1,
-					input_level
-				)
-				self.update_track_level(self.recording_track, input_level)
+		recording_track = self.recording_track
+		if self.is_recording and recording_track is not None:
+			# Hand the first input channel to the recording worker - never blocks
+			mono_input = indata[:, 0]
+			self._rec_ring.write(mono_input)
+			
+			# Quick level calculation for recording track - apply volume for level display
+			input_level = _peak_abs(mono_input)
+			self.update_track_level(recording_track, input_level)
 
 		elif not self.is_recording:
 			armed_track = None
@@ -766,82 +1212,98 @@ class AudioEngine:
 
 			if armed_track is not None:
 				# Monitor input level for armed track
-				mono_input = indata[:, 0] if indata.shape[1] > 1 else indata.flatten()
-				input_level = np.max(np.abs(mono_input))
-				self.track_levels[armed_track] = max(
-					self.track_levels[armed_track] * 1,
-					input_level
-				)
+				mono_input = indata[:, 0]
+				input_level = _peak_abs(mono_input)
 				self.update_track_level(armed_track, input_level)
 
-		# Apply decay to all track levels efficiently
-		for track_num in self.track_levels:
-			self.track_levels[track_num] *= self.level_decay
+		# Apply decay to all track levels in one vectorized op
+		self.track_levels_arr *= self.level_decay
 		
 		# Handle playback - streamlined with volume and FX
 		if self.is_playing:
-			with self.playback_lock:
-				# Pre-allocate output buffer
-				mixed_output = np.zeros((frames, 2), dtype=self.dtype)
-				
-				# Get playable tracks (considering mute/solo)
-				playable_tracks = self.get_playable_tracks()
-				
-				# Mix tracks efficiently with volume and FX
-				for track_num in playable_tracks:
-					if track_num in self.track_data:
-						track_len = self.track_lengths[track_num]
+			# Playback restarts/stops bump the generation - don't advance a stale position
+			generation = self._playback_generation
+			
+			# Reuse the preallocated mix buffer - only grows if the host asks for bigger blocks
+			if self._mixed_output.shape[0] < frames:
+				self._mixed_output = np.zeros(frames, dtype=self.dtype)
+				self._cb_scratch = np.zeros(frames, dtype=self.dtype)
+			mixed_output = self._mixed_output[:frames]
+			mixed_output.fill(0)
+			
+			# Get playable tracks (considering mute/solo)
+			playable_tracks = self.get_playable_tracks()
+			
+			# Mix tracks efficiently with volume and FX
+			for track_num in playable_tracks:
+				track_data = self.track_data[track_num]
+				if track_data is not None:
+					track_len = self.track_lengths[track_num]
+					
+					if self.playback_position < track_len:
+						remaining_samples = track_len - self.playback_position
+						samples_to_read = min(frames, remaining_samples)
 						
-						if self.playback_position < track_len:
-							remaining_samples = track_len - self.playback_position
-							samples_to_read = min(frames, remaining_samples)
+						# Get track data segment
+						track_segment = track_data[
+							self.playback_position:self.playback_position + samples_to_read
+						]
+						
+						if len(track_segment) > 0 and NUMBA_AVAILABLE:
+							# Volume, FX, level and stereo mix fused into one compiled pass - the
+							# int16 dequantize scale is folded into the volume
+							track_level = _mix_track_kernel(
+								track_segment, float(self.track_volumes_arr[track_num]) * _track_scale(track_segment),
+								*self.fx_kernel_state[track_num], mixed_output
+							)
+							self.update_track_level(track_num, track_level)
 							
-							# Get track data segment
-							track_segment = self.track_data[track_num][
-								self.playback_position:self.playback_position + samples_to_read
-							]
+						elif len(track_segment) > 0:
+							# Apply volume (and int16 dequantize)
+							track_volume = np.float32(self.track_volumes_arr[track_num] * _track_scale(track_segment))
+							processed_segment = np.multiply(
+								track_segment, track_volume, out=self._cb_scratch[:len(track_segment)]
+							)
 							
-							if len(track_segment) > 0:
-								# Apply volume
-								track_volume = self.track_volumes.get(track_num, 0.75)
-								processed_segment = track_segment * track_volume
-								
-								# Apply FX processing
+							# Apply FX processing
+							if self.track_fx_ids[track_num]:
 								processed_segment = self.process_track_fx(track_num, processed_segment)
-								
-								# Update level for visual feedback (after processing)
-								track_level = np.max(np.abs(processed_segment))
-								self.track_levels[track_num] = max(
-									self.track_levels[track_num],
-									track_level
-								)
-								self.update_track_level(track_num, track_level)
-								
-								# Convert mono to stereo and mix - optimized
-								segment_len = len(processed_segment)
-								mixed_output[:segment_len, 0] += processed_segment
-								mixed_output[:segment_len, 1] += processed_segment
-				
-				# Add metronome if enabled
-				if self.metronome_enabled:
-					self.add_metronome_optimized(mixed_output, frames)
-				
-				# Apply master volume and copy to output buffer
-				if self.master_volume_gain != 1.0:
-					mixed_output *= self.master_volume_gain
-				outdata[:] = mixed_output
-				
-				# Advance playback position
+							
+							# Update level for visual feedback (after processing)
+							track_level = _peak_abs(processed_segment)
+							self.update_track_level(track_num, track_level)
+							
+							# Mix into the mono bus - expanded to stereo once on output
+							segment_len = len(processed_segment)
+							mixed_output[:segment_len] += processed_segment
+			
+			# Add metronome if enabled
+			if self.metronome_enabled:
+				self.add_metronome_optimized(mixed_output, frames)
+			
+			# Apply master volume while expanding mono to both output channels
+			if self.master_volume_gain != 1.0:
+				np.multiply(mixed_output[:, np.newaxis], self.master_volume_gain, out=outdata)
+			else:
+				outdata[:] = mixed_output[:, np.newaxis]
+			
+			# Advance playback position
+			if generation == self._playback_generation:
 				self.playback_position += frames
 	
 	def get_playable_tracks(self):
 		"""Get list of tracks that should be played (considering mute/solo)"""
+		active_mask = self._active_mask
 		if not self.track_manager:
 			# Fallback if track manager not set
-			return list(self.track_data.keys())
+			return _mask_tracks(active_mask)
 		
-		# Use track manager's logic for playable tracks
-		return self.track_manager.get_playable_tracks()
+		# Use track manager's logic, recomputed only when track state or loaded audio has changed
+		version = (self.track_manager._state_version, active_mask)
+		if version != self._playable_version:
+			self._playable_cache = _mask_tracks(self.track_manager.get_playable_mask() & active_mask)
+			self._playable_version = version
+		return self._playable_cache
 		
 	def add_metronome_optimized(self, output, frames):
 		"""Optimized metronome addition with 'and' sound every 4th beat"""
@@ -849,57 +1311,60 @@ class AudioEngine:
 		
 		if effective_volume == 0 or self.samples_per_beat == 0:
 			return
-		
-		for i in range(frames):
-			beat_position = (self.playback_position + i) % self.samples_per_beat
-			
-			# Trigger click at beat start - use a wider window but prevent multiple triggers
-			if beat_position < len(self.metronome_sound):
-				# Determine which beat we're on (1, 2, 3, 4, 1, 2, 3, 4...)
-				current_sample = self.playback_position + i
-				current_beat = (current_sample // self.samples_per_beat) % 4 + 1
-				
-				# Use "and" sound for beat 1 (every 4th beat starting with first)
-				if current_beat == 1 and hasattr(self, 'metronome_and_sound'):
-					sound_to_use = self.metronome_and_sound
-				else:
-					sound_to_use = self.metronome_sound
-				
-				# Play the appropriate sound
-				if beat_position < len(sound_to_use):
-					click_sample = sound_to_use[beat_position] * effective_volume
-					output[i, 0] += click_sample  # Left channel
-					output[i, 1] += click_sample  # Right channel
+
+		block_start = self.playback_position
+		block_end = block_start + frames
+		click_length = min(len(self.metronome_sound), self.samples_per_beat)
+
+		# Start from the beat at or before this block - its click may still be sounding
+		beat_index = block_start // self.samples_per_beat
+		beat_start = beat_index * self.samples_per_beat
+
+		while beat_start < block_end:
+			# Use "and" sound for beat 1 (every 4th beat starting with first)
+			sound_to_use = self._metronome_bank[1 if beat_index % 4 == 0 else 0]
+
+			# Overlap between this click and the current block
+			src_begin = max(0, block_start - beat_start)
+			dst_begin = max(0, beat_start - block_start)
+			count = min(click_length - src_begin, frames - dst_begin)
+
+			if count > 0:
+				click = np.multiply(
+					sound_to_use[src_begin:src_begin + count], np.float32(effective_volume),
+					out=self._cb_scratch[:count]
+				)
+				output[dst_begin:dst_begin + count] += click  # Mono mix bus
+
+			beat_index += 1
+			beat_start += self.samples_per_beat
 		
 	def update_track_level(self, track_num, new_level):
 		"""Update track level with peak detection"""
-		current_time = time.time()
-		
-		# Initialize if needed
-		if track_num not in self.track_levels:
-			self.track_levels[track_num] = 0.0
-			self.track_peaks[track_num] = False
-			self.peak_hold_time[track_num] = 0.0
-		
-		# Update level (use max of current and new for better visualization)
-		self.track_levels[track_num] = max(self.track_levels[track_num], new_level)
-		
-		# Peak detection - use 0.95 instead of 0.7 for full range usage
-		if new_level >= 1:
-			self.track_peaks[track_num] = True
-			self.peak_hold_time[track_num] = current_time
-		elif current_time - self.peak_hold_time[track_num] > self.peak_hold_duration:
-			self.track_peaks[track_num] = False
+		_update_level(
+			self.track_levels_arr, self.track_peaks_arr, self.peak_hold_time_arr,
+			track_num, float(new_level), time.time(), self.peak_hold_duration
+		)
 			
 	def get_track_level(self, track_num):
 		"""Get current level for track (0.0 to 1.0)"""
-		level = self.track_levels.get(track_num, 0.0)
+		level = float(self.track_levels_arr[track_num])
 		# Apply some minimum threshold to avoid tiny values
 		return level if level > 0.001 else 0.0
 		
 	def get_track_peak(self, track_num):
 		"""Get peak status for track"""
-		return self.track_peaks.get(track_num, False)
+		return bool(self.track_peaks_arr[track_num])
+		
+	def get_all_levels(self):
+		"""Snapshot of every track's level (indexed by track number) for one meter redraw"""
+		levels = self.track_levels_arr.copy()
+		levels[levels <= 0.001] = 0.0
+		return levels
+		
+	def get_all_peaks(self):
+		"""Snapshot of every track's peak latch (indexed by track number)"""
+		return self.track_peaks_arr.copy()
 		
 	def export_mixdown_mp3(self, project_name):
 		"""Export all tracks as a single MP3 file"""
@@ -912,14 +1377,12 @@ class AudioEngine:
 			max_length = 0
 			playable_tracks = []
 			
-			for track_num in range(1, 9):
-				if self.has_track_data(track_num):
-					# Check if track should be included (not muted)
-					track = self.track_manager.get_track(track_num) if self.track_manager else None
-					if not track or not track.is_muted:
-						playable_tracks.append(track_num)
-						track_length = self.track_lengths.get(track_num, 0)
-						max_length = max(max_length, track_length)
+			for track_num in _mask_tracks(self._active_mask):
+				# Check if track should be included (not muted)
+				track = self.track_manager.get_track(track_num) if self.track_manager else None
+				if not track or not track.is_muted:
+					playable_tracks.append(track_num)
+					max_length = max(max_length, int(self.track_lengths[track_num]))
 			
 			if max_length == 0:
 				print("No audio data to export")
@@ -927,39 +1390,81 @@ class AudioEngine:
 			
 			print(f"Mixing {len(playable_tracks)} tracks, total length: {max_length/self.sample_rate:.2f} seconds")
 			
-			# Create stereo mix buffer
-			mixdown = np.zeros((max_length, 2), dtype=self.dtype)
+			# Tracks are mono, so mix into a mono bus and only go stereo for the file
+			mono = np.zeros(max_length, dtype=self.dtype)
+			scratch = np.empty(max_length, dtype=self.dtype) if not NUMBA_AVAILABLE else None  # Reused volume buffer
 			
-			# Mix all playable tracks
+			if NUMBA_AVAILABLE:
+				# Tracks without FX are a plain weighted sum - do them all in one multi-core pass
+				dry_tracks = [
+					n for n in playable_tracks
+					if not self.track_fx_ids[n] and self.track_data[n] is not None
+					and self.track_data[n].dtype == self.track_storage_dtype
+				]
+				if dry_tracks:
+					tracks = NumbaList([self.track_data[n] for n in dry_tracks])
+					lengths = self.track_lengths[dry_tracks]
+					gains = np.array(
+						[self.track_volumes_arr[n] * _track_scale(self.track_data[n]) for n in dry_tracks],
+						dtype=np.float32
+					)
+					_sum_tracks_kernel(tracks, lengths, gains, mono[:int(lengths.max())])
+					for track_num in dry_tracks:
+						print(f"Mixed track {track_num} (volume: {self.track_volumes_arr[track_num]:.2f}, fx: none)")
+					playable_tracks = [n for n in playable_tracks if n not in dry_tracks]
+			
+			# Mix the remaining playable tracks
 			for track_num in playable_tracks:
-				if track_num in self.track_data:
-					track_data = self.track_data[track_num]
+				track_data = self.track_data[track_num]
+				if track_data is not None:
 					track_length = len(track_data)
 					
-					# Apply volume
-					track_volume = self.track_volumes.get(track_num, 0.75)
-					processed_track = track_data * track_volume
-					
-					# Apply FX processing  
-					processed_track = self.process_track_fx(track_num, processed_track)
+					track_volume = float(self.track_volumes_arr[track_num])
 					
-					# Add to stereo mixdown
-					mixdown[:track_length, 0] += processed_track  # Left channel
-					mixdown[:track_length, 1] += processed_track  # Right channel
+					if NUMBA_AVAILABLE:
+						# Volume, FX and accumulate in one streaming pass over the track
+						_mix_track_kernel(
+							track_data, track_volume * _track_scale(track_data),
+							*self.fx_kernel_state[track_num], mono[:track_length]
+						)
+					else:
+						# Apply volume (and int16 dequantize) into the scratch buffer
+						processed_track = scratch[:track_length]
+						np.multiply(track_data, np.float32(track_volume * _track_scale(track_data)), out=processed_track)
+						
+						# Apply FX processing  
+						processed_track = self.process_track_fx(track_num, processed_track)
+						
+						# Accumulate into the mono bus
+						np.add(mono[:track_length], processed_track, out=mono[:track_length])
 					
 					print(f"Mixed track {track_num} (volume: {track_volume:.2f}, fx: {self.track_fx.get(track_num, 'none')})")
 			
 			# Normalize mixdown to prevent clipping
-			max_level = np.max(np.abs(mixdown))
+			max_level = _peak_abs(mono)
 			if max_level > 0.95:
 				normalization_factor = 0.95 / max_level
-				mixdown *= normalization_factor
+				np.multiply(mono, np.float32(normalization_factor), out=mono)
 				print(f"Normalized mixdown by {normalization_factor:.3f} to prevent clipping")
 			
-			# Save as WAV first
 			safe_project_name = self.make_safe_filename(project_name)
+			mp3_filename = export_dir / f"{safe_project_name}_mixdown.mp3"
+			
+			# Encode straight from memory when ffmpeg is on the PATH
+			if shutil.which('ffmpeg') is not None:
+				if self._ffmpeg_encode_mp3(mono, self.sample_rate, mp3_filename):
+					print(f"✓ Exported MP3 mixdown: {mp3_filename}")
+					return True
+				print("ffmpeg encode failed, falling back to WAV export")
+			
+			# Save as WAV first
 			wav_filename = export_dir / f"{safe_project_name}_mixdown.wav"
-			sf.write(str(wav_filename), mixdown, self.sample_rate)
+			# Write stereo as broadcast views of the mono bus, a block at a time, so the
+			# full (N, 2) buffer is never materialized
+			with sf.SoundFile(str(wav_filename), 'w', self.sample_rate, channels=2) as wav_file:
+				for block_start in range(0, len(mono), 65536):
+					block = mono[block_start:block_start + 65536]
+					wav_file.write(np.broadcast_to(block[:, np.newaxis], (len(block), 2)))
 			print(f"Saved WAV mixdown: {wav_filename}")
 			
 			# Convert to MP3
@@ -969,7 +1474,6 @@ class AudioEngine:
 				
 				# Load WAV and export as MP3
 				audio = AudioSegment.from_wav(str(wav_filename))
-				mp3_filename = export_dir / f"{safe_project_name}_mixdown.mp3"
 				audio.export(str(mp3_filename), format="mp3", bitrate="192k")
 				
 				# Delete temporary WAV file
@@ -988,11 +1492,32 @@ class AudioEngine:
 			print(f"Error exporting mixdown: {e}")
 			return False
 			
+	def _ffmpeg_encode_mp3(self, mono, sample_rate, out_path):
+		"""Pipe mono float32 PCM into ffmpeg and write a 192k stereo MP3"""
+		command = [
+			'ffmpeg', '-y', '-loglevel', 'error',
+			'-f', 'f32le', '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0',
+			'-ac', '2', '-b:a', '192k', '-f', 'mp3', str(out_path)
+		]
+		try:
+			proc = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+			_, stderr = proc.communicate(np.ascontiguousarray(mono, dtype='<f4').tobytes())
+			if proc.returncode != 0:
+				print(f"ffmpeg error: {stderr.decode(errors='replace').strip()}")
+				return False
+			return True
+		except Exception as e:
+			print(f"Could not run ffmpeg: {e}")
+			return False
+			
 	def start_stream(self):
 		"""Start audio stream with low-latency settings"""
 		if self.stream is not None:
 			self.stop_stream()
 			
+		# A new stream may run its callback on a new thread
+		self._callback_thread_ready = False
+			
 		try:
 			input_dev = self.input_device if self.input_device is not None else sd.default.device[0]
 			output_dev = self.output_device if self.output_device is not None else sd.default.device[1]
@@ -1042,9 +1567,18 @@ class AudioEngine:
 				return False
 				
 		with self.recording_lock:
-			self.is_recording = True
+			# Reuse the take buffer from earlier recordings - it only ever grows
+			if self._rec_buf.size == 0:
+				self._rec_buf = np.empty(self.sample_rate * 60, dtype=np.float32)
+			self._rec_write = 0
+			self._rec_ring.reset()
+			
+			self._rec_worker_running = True
+			self._rec_worker = threading.Thread(target=self._recording_worker, daemon=True)
+			self._rec_worker.start()
+			
 			self.recording_track = track_number
-			self.recording_buffer = []
+			self.is_recording = True
 			
 		print(f"Started recording to track {track_number}")
 		return True
@@ -1057,25 +1591,31 @@ class AudioEngine:
 		with self.recording_lock:
 			self.is_recording = False
 			track_num = self.recording_track
-			buffer_copy = self.recording_buffer.copy()
-			self.recording_buffer = []
 			self.recording_track = None
-		
-		if len(buffer_copy) > 0 and track_num is not None:
-			# Convert to numpy array
-			audio_data = np.array(buffer_copy, dtype=self.dtype)
 			
-			# Apply latency compensation - trim the beginning
-			if self.measured_latency_samples > 0:
-				if len(audio_data) > self.measured_latency_samples:
-					audio_data = audio_data[self.measured_latency_samples:]
+			# Let the worker drain whatever the callback has already pushed
+			self._stop_recording_worker()
+			recorded_length = self._rec_write
+			
+			# Apply latency compensation - trim the beginning of the take
+			trim = 0
+			if recorded_length > 0 and self.measured_latency_samples > 0:
+				if recorded_length > self.measured_latency_samples:
+					trim = self.measured_latency_samples
 					print(f"✓ Applied latency compensation: removed {self.measured_latency_ms:.1f}ms")
 				else:
 					print("⚠ Recording too short for latency compensation")
 			
+			# Single copy out of the reusable take buffer
+			audio_data = self._rec_buf[trim:recorded_length].astype(self.dtype)
+			self._rec_write = 0
+			
+			if self._rec_ring.dropped:
+				print(f"⚠ Recording ring overflowed, dropped {self._rec_ring.dropped} samples")
+		
+		if len(audio_data) > 0 and track_num is not None:
 			# Store in track data
-			self.track_data[track_num] = audio_data
-			self.track_lengths[track_num] = len(audio_data)
+			self.set_track_audio(track_num, audio_data)
 			
 			# Save to project-specific directory
 			recordings_dir = Path(self.recordings_dir)
@@ -1091,6 +1631,31 @@ class AudioEngine:
 				
 		return None
 		
+	def _recording_worker(self):
+		"""Drain the recording ring into the take buffer until recording stops"""
+		while self._rec_worker_running:
+			self._drain_recording_ring()
+			time.sleep(0.01)
+		self._drain_recording_ring()
+		
+	def _drain_recording_ring(self):
+		"""Move all pending samples from the ring into _rec_buf"""
+		available = self._rec_ring.available()
+		if available == 0:
+			return
+			
+		needed = self._rec_write + available
+		if needed > self._rec_buf.size:
+			self._rec_buf = np.resize(self._rec_buf, max(self._rec_buf.size * 2, needed))
+		self._rec_write += self._rec_ring.read_into(self._rec_buf[self._rec_write:needed])
+		
+	def _stop_recording_worker(self):
+		"""Stop the recording worker after its final drain"""
+		self._rec_worker_running = False
+		if self._rec_worker is not None:
+			self._rec_worker.join()
+			self._rec_worker = None
+		
 	def start_playback(self):
 		"""Start playback of all tracks"""
 		if not self.stream or not self.stream.active:
@@ -1098,23 +1663,24 @@ class AudioEngine:
 				return False
 				
 		with self.playback_lock:
-			self.is_playing = True
+			self._playback_generation += 1
 			self.playback_position = 0
 			self.playback_start_time = time.time()
+			self.is_playing = True
 			
 		print("Started playback")
 		return True
 		
 	def pause_playback(self):
 		"""Pause playback"""
-		with self.playback_lock:
-			self.is_playing = False
+		self.is_playing = False
 		print("Paused playback")
 		
 	def stop_playback(self):
 		"""Stop playback and reset position"""
 		with self.playback_lock:
 			self.is_playing = False
+			self._playback_generation += 1
 			self.playback_position = 0
 			self.playback_start_time = 0
 		print("Stopped playback")
@@ -1133,15 +1699,10 @@ class AudioEngine:
 		
 	def clear_track(self, track_number):
 		"""Clear specific track"""
-		if track_number in self.track_data:
-			del self.track_data[track_number]
-		if track_number in self.track_lengths:
-			del self.track_lengths[track_number]
+		self.set_track_audio(track_number, None)
 		# Clear level data for the track
-		if track_number in self.track_levels:
-			self.track_levels[track_number] = 0.0
-		if track_number in self.track_peaks:
-			self.track_peaks[track_number] = False
+		self.track_levels_arr[track_number] = 0.0
+		self.track_peaks_arr[track_number] = False
 		print(f"Cleared track {track_number}")
 		
 	def set_metronome(self, enabled):
@@ -1151,11 +1712,75 @@ class AudioEngine:
 		
 	def get_track_count(self):
 		"""Get number of recorded tracks"""
-		return len(self.track_data)
+		return bin(self._active_mask).count('1')
+		
+	def quantize_track_audio(self, audio_data):
+		"""Convert float audio to the track storage format"""
+		if audio_data.dtype == self.track_storage_dtype:
+			return np.ascontiguousarray(audio_data)
+		if self.track_storage_dtype == np.int16:
+			audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+			# int16 would clip anything past full scale - such tracks stay float32 instead
+			if _peak_abs(audio_data) > 1.0:
+				print("Track audio peaks above full scale - storing it as float32")
+				return audio_data
+			scaled = np.rint(audio_data * np.float32(INT16_SCALE))
+			return np.clip(scaled, -32768, 32767).astype(np.int16)
+		return np.asarray(audio_data, dtype=np.float32)
+		
+	def set_track_audio(self, track_number, audio_data):
+		"""Store (or with None/empty audio, clear) a track's audio and keep the active mask in step"""
+		if audio_data is None or len(audio_data) == 0:
+			self.track_data[track_number] = None
+			self.track_lengths[track_number] = 0
+			self._active_mask &= ~(1 << track_number)
+		else:
+			self.track_data[track_number] = self.quantize_track_audio(audio_data)
+			self.track_lengths[track_number] = len(audio_data)
+			self._active_mask |= 1 << track_number
+		# Bumped last - whoever sees the new version also sees the new data and length
+		self.track_data_versions[track_number] += 1
+		self.ui_queue.put(('track_data', track_number))
+		
+	def clear_all_track_audio(self):
+		"""Drop the audio of every track"""
+		self._active_mask = 0
+		self.track_data[:] = [None] * 9
+		self.track_lengths.fill(0)
+		self.track_data_versions[:] = [version + 1 for version in self.track_data_versions]
+		
+	def get_track_audio(self, track_number):
+		"""Get a track's audio as float32 regardless of storage format, or None"""
+		if not 1 <= track_number <= 8:
+			return None
+		track_data = self.track_data[track_number]
+		if track_data is None:
+			return None
+		if track_data.dtype == np.int16:
+			return track_data * np.float32(1.0 / INT16_SCALE)
+		return track_data
+		
+	def get_track_envelope(self, track_number, columns):
+		"""Per-column RMS of a track (full scale = 1.0) computed straight from storage, or None"""
+		if not 1 <= track_number <= 8:
+			return None
+		track_data = self.track_data[track_number]
+		if track_data is None or len(track_data) == 0:
+			return None
+		# Equal buckets - the few tail samples past the last full column are left out
+		envelope = np.empty(min(columns, len(track_data)), dtype=np.float32)
+		_rms_envelope(track_data, envelope)
+		if track_data.dtype == np.int16:
+			envelope *= np.float32(1.0 / INT16_SCALE)
+		return envelope
 		
 	def has_track_data(self, track_number):
 		"""Check if track has recorded data"""
-		return track_number in self.track_data and len(self.track_data[track_number]) > 0
+		return 1 <= track_number <= 8 and bool(self._active_mask >> track_number & 1)
+		
+	def has_data_mask(self):
+		"""Bitmask of tracks holding audio - bit n is track n"""
+		return self._active_mask
 		
 	def set_recordings_directory(self, recordings_dir):
 		"""Set the recordings directory for current project"""
@@ -1172,18 +1797,20 @@ class AudioEngine:
 			'buffer_size': self.buffer_size
 		}
 		
+	def publish_latency_info(self):
+		"""Queue the current latency info for the UI - called whenever the measurement changes"""
+		self.ui_queue.put(('latency', self.get_latency_info()))
+		
 	def load_project_audio_files(self, project_name):
 		"""Load audio files for a specific project"""
 		try:
 			# Clear current audio data first
-			self.track_data.clear()
-			self.track_lengths.clear()
+			self.clear_all_track_audio()
 		
 			# Reset all track levels
-			for i in range(1, 9):
-				self.track_levels[i] = 0.0
-				self.track_peaks[i] = False
-				self.peak_hold_time[i] = 0.0
+			self.track_levels_arr.fill(0.0)
+			self.track_peaks_arr.fill(False)
+			self.peak_hold_time_arr.fill(0.0)
 		
 			# Look for audio files in the project's recordings directory
 			safe_project_name = self.make_safe_filename(project_name)
@@ -1196,54 +1823,23 @@ class AudioEngine:
 					print(f"No recordings directory found for project: {project_name}")
 					return
 			
-			# Load the most recent audio file for each track
+			# Load the most recent audio file for each track - one directory scan for all of them
+			latest_files = self.find_latest_track_files(project_recordings_dir, safe_project_name)
 			loaded_count = 0
-			for track_num in range(1, 9):
-				# Try multiple patterns
-				patterns = [
-					f"track_{track_num}_*.wav",
-					f"{safe_project_name}_track_{track_num}_*.wav"
-				]
-			
-				track_files = []
-				for pattern in patterns:
-					track_files.extend(list(project_recordings_dir.glob(pattern)))
 			
-				if track_files:
-					# Get the most recent file for this track
-					latest_file = max(track_files, key=lambda p: p.stat().st_mtime)
-				
+			# Decode and resample the tracks concurrently - libsndfile and SciPy release the GIL
+			with ThreadPoolExecutor(max_workers=max(1, len(latest_files))) as executor:
+				futures = {
+					track_num: executor.submit(self.read_track_file, track_num, latest_file)
+					for track_num, latest_file in latest_files.items()
+				}
+				for track_num in sorted(futures):
 					try:
-						# Load the audio file
-						audio_data, sample_rate = sf.read(str(latest_file))
-					
-						# Resample if needed
-						if sample_rate != self.sample_rate:
-							print(f"Resampling track {track_num} from {sample_rate}Hz to {self.sample_rate}Hz")
-							try:
-								from scipy import signal
-								num_samples = int(len(audio_data) * self.sample_rate / sample_rate)
-								audio_data = signal.resample(audio_data, num_samples)
-							except ImportError:
-								# Fallback resampling
-								ratio = self.sample_rate / sample_rate
-								new_length = int(len(audio_data) * ratio)
-								audio_data = np.interp(
-									np.linspace(0, len(audio_data)-1, new_length),
-									np.arange(len(audio_data)),
-									audio_data
-								)
-					
-						# Convert to mono if stereo
-						if len(audio_data.shape) > 1:
-							audio_data = np.mean(audio_data, axis=1)
-					
 						# Store in track data
-						self.track_data[track_num] = audio_data.astype(self.dtype)
-						self.track_lengths[track_num] = len(audio_data)
+						self.set_track_audio(track_num, futures[track_num].result())
 						loaded_count += 1
 					
-						print(f"✓ Loaded audio for track {track_num}: {latest_file.name}")
+						print(f"✓ Loaded audio for track {track_num}: {latest_files[track_num].name}")
 					
 					except Exception as e:
 						print(f"✗ Failed to load audio for track {track_num}: {e}")
@@ -1253,47 +1849,87 @@ class AudioEngine:
 		except Exception as e:
 			print(f"Error loading project audio files: {e}")
 			
-	def make_safe_filename(self, filename):
-		"""Convert filename to safe format"""
-		# Remove or replace invalid characters
-		invalid_chars = '<>:"/\\|?*'
-		safe_name = filename
+	def read_track_file(self, track_num, file_path):
+		"""Read one track's audio file as mono at the engine rate, in track storage format"""
+		# Load the audio file straight into float32 - or int16 when it's already in storage format
+		with sf.SoundFile(str(file_path)) as f:
+			sample_rate = f.samplerate
+			# Only integer PCM is sure to fit int16 - float files can go past full scale
+			if (f.channels == 1 and sample_rate == self.sample_rate and self.track_storage_dtype == np.int16
+					and f.subtype.startswith('PCM')):
+				audio_data = f.read(dtype='int16')
+			else:
+				audio_data = f.read(dtype='float32')
+	
+		# Convert to mono if stereo - before resampling so only one channel is filtered
+		if len(audio_data.shape) > 1:
+			audio_data = _downmix_to_mono(audio_data)
+	
+		# Resample if needed
+		if sample_rate != self.sample_rate:
+			print(f"Resampling track {track_num} from {sample_rate}Hz to {self.sample_rate}Hz")
+			audio_data = self.resample_audio(audio_data, sample_rate)
+		
+		return self.quantize_track_audio(audio_data)
+		
+	def find_latest_track_files(self, recordings_dir, safe_project_name):
+		"""Map track number to its newest recording in a directory - cached on directory mtime"""
+		recordings_dir = Path(recordings_dir)
+		dir_mtime = recordings_dir.stat().st_mtime_ns
+		cache_key = (str(recordings_dir), safe_project_name)
+		cached = self._track_file_scan_cache.get(cache_key)
+		if cached is not None and cached[0] == dir_mtime:
+			return cached[1]
+		
+		# Matches both track_N_*.wav and <project>_track_N_*.wav - only for tracks 1-8, like the old per-track globs
+		pattern = re.compile(rf'(?:{re.escape(safe_project_name)}_)?track_([1-8])_.*\.wav')
+		
+		newest = {}  # {track_num: (mtime, path)}
+		with os.scandir(recordings_dir) as entries:
+			for entry in entries:
+				match = pattern.fullmatch(entry.name)
+				if match is None or not entry.is_file():
+					continue
+				track_num = int(match.group(1))
+				mtime = entry.stat().st_mtime
+				if track_num not in newest or mtime > newest[track_num][0]:
+					newest[track_num] = (mtime, Path(entry.path))
 		
-		for char in invalid_chars:
-			safe_name = safe_name.replace(char, '_')
-			
-		# Remove leading/trailing spaces and dots
-		safe_name = safe_name.strip(' .')
+		latest_files = {track_num: path for track_num, (_, path) in newest.items()}
+		self._track_file_scan_cache[cache_key] = (dir_mtime, latest_files)
+		return latest_files
 		
-		# Ensure not empty
-		if not safe_name:
-			safe_name = "untitled"
-			
-		return safe_name
+	def make_safe_filename(self, filename):
+		"""Convert filename to safe format"""
+		return make_safe_filename(filename)
 		
 	def clear_all_project_data(self):
 		"""Clear all project audio data - for NEW PROJECT"""
 		try:
 			# Clear all track data
-			self.track_data.clear()
-			self.track_lengths.clear()
+			self.clear_all_track_audio()
 			
 			# Reset all track levels and peaks
+			self.track_levels_arr.fill(0.0)
+			self.track_peaks_arr.fill(False)
+			self.peak_hold_time_arr.fill(0.0)
+			
+			# Reset track settings to defaults
+			self.track_volumes_arr.fill(0.75)
+			self.track_fx_ids.fill(0)
 			for i in range(1, 9):
-				self.track_levels[i] = 0.0
-				self.track_peaks[i] = False
-				self.peak_hold_time[i] = 0.0
-				# Reset track settings to defaults
-				self.track_volumes[i] = 0.75
 				self.track_fx[i] = "none"
 				self.fx_processors[i] = {}
+				self.fx_kernel_state[i] = _fx_kernel_state({})
 			
 			# Stop any ongoing playback/recording
 			self.stop_playback()
 			if self.is_recording:
 				self.is_recording = False
 				with self.recording_lock:
-					self.recording_buffer.clear()
+					self._stop_recording_worker()
+					self._rec_buf = np.empty(0, dtype=np.float32)
+					self._rec_write = 0
 					self.recording_track = None
 			
 			print("✓ Cleared all project audio data")
@@ -8,7 +8,6 @@ import tkinter as tk
 import sys
 import os
 import threading
-import time
 from pathlib import Path
 from PIL import Image, ImageTk, ImageEnhance
 
@@ -65,9 +64,23 @@ class MultitrackRecorderApp:
 			deer_image_path = get_resource_path("deer.jpg")
 			if os.path.exists(deer_image_path):
 				print("deer.jpg found, loading as background...")
-				# Load and resize image to fit window
-				pil_image = Image.open(deer_image_path)
-				pil_image = pil_image.resize((1500, 900), Image.Resampling.LANCZOS)
+				# Load the resized image from cache, keyed on the source file's mtime
+				cache_dir = Path.home() / ".cache" / "clifs8track"
+				cache_path = cache_dir / f"deer_1500x900_{os.stat(deer_image_path).st_mtime_ns}.png"
+				if cache_path.exists():
+					pil_image = Image.open(cache_path)
+				else:
+					# Let the JPEG decoder downscale by DCT scaling before the Lanczos pass
+					pil_image = Image.open(deer_image_path)
+					pil_image.draft('RGB', (1500, 900))
+					pil_image = pil_image.resize((1500, 900), Image.Resampling.LANCZOS)
+					try:
+						cache_dir.mkdir(parents=True, exist_ok=True)
+						for stale_file in cache_dir.glob("deer_1500x900_*.png"):
+							stale_file.unlink()
+						pil_image.save(cache_path)
+					except Exception as e:
+						print(f"Could not cache background image: {e}")
 				
 				# Convert to PhotoImage
 				self.bg_image = ImageTk.PhotoImage(pil_image)
@@ -98,8 +111,8 @@ class MultitrackRecorderApp:
 			self.audio_engine.initialize()
 			print("Audio engine initialized")
 		
-			# Show startup calibration popup
-			self.show_startup_calibration()
+			# Show startup calibration popup once the mainloop is idle
+			self.root.after_idle(self.show_startup_calibration)
 		
 			self.root.mainloop()
 		except Exception as e:
@@ -149,20 +162,18 @@ class MultitrackRecorderApp:
 				fg='#ffffff'
 			).pack(pady=(0, 10))
 		
-			self.calibration_popup.update()
-		
 			# Start calibration in background
 			def calibration_thread():
 				try:
-					time.sleep(1)  # Brief delay
 					self.audio_engine.measure_latency()
 					# Close popup in main thread
-					self.root.after(0, self.close_startup_calibration)
+					self.ui.post_to_ui(self.close_startup_calibration)
 				except Exception as e:
 					print(f"Startup calibration failed: {e}")
-					self.root.after(0, self.close_startup_calibration)
+					self.ui.post_to_ui(self.close_startup_calibration)
 		
-			threading.Thread(target=calibration_thread, daemon=True).start()
+			# Brief delay on Tk's timer - the worker only exists for the blocking measurement
+			self.root.after(1000, lambda: threading.Thread(target=calibration_thread, daemon=True).start())
 			
 		except Exception as e:
 			print(f"Could not show calibration popup: {e}")
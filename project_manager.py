@@ -9,14 +9,50 @@ from pathlib import Path
 from datetime import datetime
 import shutil
 import glob
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# ijson is optional - it lets the project list skim files without building the whole document
+try:
+	import ijson
+except ImportError:
+	ijson = None
+
+# orjson is optional - a faster encoder for saving projects, with the json module as fallback
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# Invalid filename characters mapped to underscores for make_safe_filename
+_INVALID_FILENAME_TABLE = str.maketrans('<>:"/\\|?*', '_________')
+
+def make_safe_filename(filename):
+	"""Convert filename to safe format - shared with the audio engine's recording names"""
+	# Replace invalid characters in one pass, strip spaces/dots, ensure not empty
+	return filename.translate(_INVALID_FILENAME_TABLE).strip(' .') or "untitled"
+
+def _walk_wav_files(root):
+	"""Yield DirEntry objects for every .wav file under root, via scandir's cached metadata"""
+	with os.scandir(root) as entries:
+		for entry in entries:
+			if entry.is_dir(follow_symlinks=False):
+				yield from _walk_wav_files(entry.path)
+			elif entry.name.endswith('.wav'):
+				yield entry
 
 class ProjectManager:
 	def __init__(self):
 		self.current_project = None
 		self.current_project_name = "Default Project"
+		self._safe_project_name_cache = None  # (current_project_name, its safe filename)
+		self._ensured_recordings_folder = None  # Recordings folder already created this session
 		self.projects_dir = Path("projects")
 		self.recordings_dir = Path("recordings") 
 		self.default_project_name = "Untitled Project"
+		self._project_list_cache = {}  # {project file path: (mtime_ns, summary)}
 		
 		# Ensure directories exist
 		self.projects_dir.mkdir(exist_ok=True)
@@ -28,10 +64,11 @@ class ProjectManager:
 			name = "Default Project"
 			
 		self.current_project_name = name.strip()
+		self._safe_project_name_cache = None
+		self._ensured_recordings_folder = None
 		
 		# Create project-specific recordings directory only
-		recordings_folder = self.recordings_dir / self.make_safe_filename(self.current_project_name)
-		recordings_folder.mkdir(exist_ok=True)
+		recordings_folder = self.get_current_recordings_folder()
 		
 		print(f"Project set to: {self.current_project_name}")
 		print(f"Recordings will be saved to: {recordings_folder}")
@@ -40,20 +77,26 @@ class ProjectManager:
 		
 	def get_current_recordings_folder(self):
 		"""Get the recordings folder for current project"""
-		recordings_folder = self.recordings_dir / self.make_safe_filename(self.current_project_name)
-		recordings_folder.mkdir(exist_ok=True)
+		recordings_folder = self.recordings_dir / self.safe_current_project_name()
+		# Only create it the first time it's asked for - later calls skip the mkdir syscall
+		if recordings_folder != self._ensured_recordings_folder:
+			recordings_folder.mkdir(exist_ok=True)
+			self._ensured_recordings_folder = recordings_folder
 		return str(recordings_folder)
 		
 	def create_new_project(self, name=None):
 		"""Create a new empty project"""
+		# Read the clock once for the default name and both timestamps
+		now = datetime.now()
 		if name is None:
-			timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+			timestamp = now.strftime("%Y%m%d_%H%M%S")
 			name = f"Project_{timestamp}"
 			
+		now_iso = now.isoformat()
 		self.current_project = {
 			'name': name,
-			'created': datetime.now().isoformat(),
-			'modified': datetime.now().isoformat(),
+			'created': now_iso,
+			'modified': now_iso,
 			'bpm': 120,
 			'metronome_enabled': False,
 			'tracks': {}
@@ -76,19 +119,21 @@ class ProjectManager:
 		
 		# Save track states including volume and FX
 		self.current_project['tracks'] = {}
+		track_states = track_manager.get_all_track_states()
+		engine_params = audio_engine.snapshot_track_params()
 		for track_num in range(1, 9):
-			track = track_manager.get_track(track_num)		
+			track = track_states.get(track_num)
 			if track:
-				# Check audio engine for actual data presence
-				actual_has_data = audio_engine.has_track_data(track_num)
-				self.current_project['tracks'][track_num] = {
-					'has_data': actual_has_data,  # Use actual data presence
-					'is_muted': track.is_muted,
-					'volume': track.volume,
-					'name': track.name,
+				params = engine_params[track_num]
+				# String keys match what JSON round-trips, so loaded and saved projects look the same
+				self.current_project['tracks'][str(track_num)] = {
+					'has_data': params['has_data'],  # Use actual data presence from the audio engine
+					'is_muted': track['is_muted'],
+					'volume': track['volume'],
+					'name': track['name'],
 					# Save FX settings from audio engine
-					'fx_type': audio_engine.get_track_fx(track_num),
-					'track_volume': audio_engine.get_track_volume(track_num)
+					'fx_type': params['fx_type'],
+					'track_volume': params['track_volume']
 				}
 		
 		# Save project file directly to projects folder (no subfolders)
@@ -97,18 +142,31 @@ class ProjectManager:
 		project_file = self.projects_dir / f"{safe_name}.json"
 		
 		try:
-			with open(project_file, 'w') as f:
-				json.dump(self.current_project, f, indent=2)
+			self.write_project_file(project_file, self.current_project)
+			self._project_list_cache.pop(str(project_file), None)
 			print(f"Project saved: {project_file}")
 			return str(project_file)
 		except Exception as e:
 			print(f"Error saving project: {e}")
 			return None
 			
+	def write_project_file(self, project_file, project_data):
+		"""Encode project data in one go and swap it into place atomically"""
+		if orjson is not None:
+			data = orjson.dumps(project_data, option=orjson.OPT_INDENT_2)
+		else:
+			data = json.dumps(project_data, indent=2).encode('utf-8')
+		
+		# A crash mid-write leaves the previous project file intact
+		tmp_file = Path(project_file).with_suffix('.json.tmp')
+		with open(tmp_file, 'wb') as f:
+			f.write(data)
+		os.replace(tmp_file, project_file)
+		
 	def load_project(self, project_file):
 		"""Load project from file"""
 		try:
-			with open(project_file, 'r') as f:
+			with open(project_file, 'rb') as f:  # orjson writes UTF-8 - let json detect it rather than use the locale
 				self.current_project = json.load(f)
 			print(f"Project loaded: {project_file}")
 			return True
@@ -158,22 +216,27 @@ class ProjectManager:
 		projects = []
 		
 		try:
-			for project_file in self.projects_dir.glob("*.json"):
-				try:
-					with open(project_file, 'r') as f:
-						project_data = json.load(f)
-					
-					projects.append({
-						'name': project_data.get('name', project_file.stem),
-						'file': str(project_file),
-						'created': project_data.get('created', ''),
-						'modified': project_data.get('modified', ''),
-						'track_count': len([t for t in project_data.get('tracks', {}).values() 
-										  if t.get('has_data', False)])
-					})
-				except:
-					# Skip corrupted project files
-					continue
+			# One directory pass - only files whose mtime changed since the last listing are re-read
+			cache = {}
+			with os.scandir(self.projects_dir) as entries:
+				for entry in entries:
+					if entry.name.startswith('.') or not entry.name.endswith('.json'):
+						continue
+					try:
+						mtime_ns = entry.stat().st_mtime_ns
+						cached = self._project_list_cache.get(entry.path)
+						if cached is not None and cached[0] == mtime_ns:
+							summary = cached[1]
+						else:
+							summary = self.read_project_summary(Path(entry.path))
+						cache[entry.path] = (mtime_ns, summary)
+						projects.append(dict(summary))
+					except:
+						# Skip corrupted project files
+						continue
+			
+			# Entries for deleted files drop out here
+			self._project_list_cache = cache
 					
 		except Exception as e:
 			print(f"Error getting project list: {e}")
@@ -182,10 +245,47 @@ class ProjectManager:
 		projects.sort(key=lambda x: x['modified'], reverse=True)
 		return projects
 		
+	def read_project_summary(self, project_file):
+		"""Read the fields the project list shows, streaming the file when ijson is available"""
+		summary = {
+			'name': project_file.stem,
+			'file': str(project_file),
+			'created': '',
+			'modified': '',
+			'track_count': 0
+		}
+		
+		if ijson is not None:
+			try:
+				# Pick the top-level strings and count tracks.<n>.has_data == true as they stream past
+				with open(project_file, 'rb') as f:
+					for prefix, event, value in ijson.parse(f):
+						if event == 'string' and prefix in ('name', 'created', 'modified'):
+							summary[prefix] = value
+						elif event == 'boolean' and value and prefix.startswith('tracks.') and prefix.endswith('.has_data'):
+							summary['track_count'] += 1
+				return summary
+			except Exception:
+				# Fall back to the standard parser below
+				summary.update(name=project_file.stem, created='', modified='', track_count=0)
+		
+		with open(project_file, 'rb') as f:
+			project_data = json.load(f)
+		
+		summary.update(
+			name=project_data.get('name', project_file.stem),
+			created=project_data.get('created', ''),
+			modified=project_data.get('modified', ''),
+			track_count=len([t for t in project_data.get('tracks', {}).values()
+							 if t.get('has_data', False)])
+		)
+		return summary
+		
 	def delete_project(self, project_file):
 		"""Delete a project file"""
 		try:
 			Path(project_file).unlink()
+			self._project_list_cache.pop(str(project_file), None)
 			print(f"Deleted project: {project_file}")
 			return True
 		except Exception as e:
@@ -200,21 +300,14 @@ class ProjectManager:
 			# Get current project's recording directory
 			recordings_folder = Path(self.get_current_recordings_folder())
 			
-			# Create pattern for current project's track files
-			safe_project_name = self.make_safe_filename(self.current_project_name)
-			patterns = [
-				f"{safe_project_name}_track_{track_num}_*.wav",  # New naming format
-				f"track_{track_num}_*.wav"  # Legacy naming format
-			]
-			
-			for pattern in patterns:
-				for audio_file in recordings_folder.glob(pattern):
-					try:
-						audio_file.unlink()
-						deleted_count += 1
-						print(f"Deleted: {audio_file}")
-					except Exception as e:
-						print(f"Failed to delete {audio_file}: {e}")
+			# Match current project's track files in a single directory pass
+			for entry in self.scan_track_files(recordings_folder, [track_num]).get(track_num, []):
+				try:
+					os.unlink(entry.path)
+					deleted_count += 1
+					log.debug("Deleted: %s", entry.path)
+				except Exception as e:
+					print(f"Failed to delete {entry.path}: {e}")
 			
 			print(f"Deleted {deleted_count} files for track {track_num}")
 			return deleted_count
@@ -238,34 +331,28 @@ class ProjectManager:
 			
 			# Copy project file
 			project_file = export_path / f"{safe_name}.json"
-			with open(project_file, 'w') as f:
-				json.dump(self.current_project, f, indent=2)
+			self.write_project_file(project_file, self.current_project)
 				
 			# Copy audio files for tracks with data
 			audio_files_copied = 0
 			recordings_folder = Path(self.get_current_recordings_folder())
 			
-			for track_num in range(1, 9):
-				if audio_engine.has_track_data(track_num):
-					# Look for the most recent recording file for this track
-					safe_project_name = self.make_safe_filename(self.current_project_name)
-					patterns = [
-						f"{safe_project_name}_track_{track_num}_*.wav",  # New format
-						f"track_{track_num}_*.wav"  # Legacy format
-					]
-					
-					latest_file = None
-					for pattern in patterns:
-						recordings = list(recordings_folder.glob(pattern))
-						if recordings:
-							# Get the most recent file from this pattern
-							pattern_latest = max(recordings, key=lambda p: p.stat().st_mtime)
-							if latest_file is None or pattern_latest.stat().st_mtime > latest_file.stat().st_mtime:
-								latest_file = pattern_latest
-					
-					if latest_file:
-						dest_file = export_path / f"track_{track_num}.wav"
-						shutil.copy2(latest_file, dest_file)
+			data_mask = audio_engine.has_data_mask()
+			tracks_with_data = [n for n in range(1, 9) if data_mask >> n & 1]
+			track_files = self.scan_track_files(recordings_folder, tracks_with_data)
+			
+			copy_jobs = []
+			for track_num, entries in track_files.items():
+				# Copy the most recent recording file for this track - DirEntry caches the stat
+				latest_file = max(entries, key=lambda entry: entry.stat().st_mtime)
+				copy_jobs.append((latest_file.path, export_path / f"track_{track_num}.wav"))
+			
+			# Plain data copies (sendfile on Linux) run concurrently - they release the GIL
+			if copy_jobs:
+				with ThreadPoolExecutor(max_workers=4) as executor:
+					futures = [executor.submit(shutil.copyfile, src, dest) for src, dest in copy_jobs]
+					for future in futures:
+						future.result()
 						audio_files_copied += 1
 						
 			print(f"Project exported to {export_path}")
@@ -276,23 +363,41 @@ class ProjectManager:
 			print(f"Error exporting project: {e}")
 			return False
 			
-	def make_safe_filename(self, filename):
-		"""Convert filename to safe format"""
-		# Remove or replace invalid characters
-		invalid_chars = '<>:"/\\|?*'
-		safe_name = filename
+	def scan_track_files(self, recordings_folder, track_nums):
+		"""Group a folder's .wav recordings by track in one scandir pass - {track_num: [DirEntry]}"""
+		# Both prefixes are built once - the track number is then read straight out of the name
+		project_prefix = f"{self.safe_current_project_name()}_track_"  # New naming format
+		legacy_prefix = "track_"  # Legacy naming format
+		wanted = {str(track_num): track_num for track_num in track_nums}
 		
-		for char in invalid_chars:
-			safe_name = safe_name.replace(char, '_')
-			
-		# Remove leading/trailing spaces and dots
-		safe_name = safe_name.strip(' .')
+		track_files = {}
+		with os.scandir(recordings_folder) as entries:
+			for entry in entries:
+				name = entry.name
+				if not name.endswith('.wav'):
+					continue
+				if name.startswith(project_prefix):
+					rest = name[len(project_prefix):]
+				elif name.startswith(legacy_prefix):
+					rest = name[len(legacy_prefix):]
+				else:
+					continue
+				number, separator, _ = rest.partition('_')
+				if separator and number in wanted:
+					track_files.setdefault(wanted[number], []).append(entry)
+		return track_files
 		
-		# Ensure not empty
-		if not safe_name:
-			safe_name = "untitled"
-			
-		return safe_name
+	def safe_current_project_name(self):
+		"""Safe filename for the current project name, recomputed only when the name changes"""
+		cache = self._safe_project_name_cache
+		if cache is None or cache[0] != self.current_project_name:
+			cache = (self.current_project_name, self.make_safe_filename(self.current_project_name))
+			self._safe_project_name_cache = cache
+		return cache[1]
+		
+	def make_safe_filename(self, filename):
+		"""Convert filename to safe format"""
+		return make_safe_filename(filename)
 		
 	def get_current_project_info(self):
 		"""Get information about current project"""
@@ -314,18 +419,11 @@ class ProjectManager:
 			cutoff_time = datetime.now().timestamp() - (days_to_keep * 24 * 3600)
 			cleaned_files = 0
 			
-			# Clean up files in all project recording folders
-			for project_folder in self.recordings_dir.iterdir():
-				if project_folder.is_dir():
-					for audio_file in project_folder.glob("*.wav"):
-						if audio_file.stat().st_mtime < cutoff_time:
-							audio_file.unlink()
-							cleaned_files += 1
-			
-			# Also clean up any files directly in recordings folder (legacy)
-			for audio_file in self.recordings_dir.glob("*.wav"):
-				if audio_file.stat().st_mtime < cutoff_time:
-					audio_file.unlink()
+			# Clean up files in all project recording folders and any legacy files directly in
+			# the recordings folder - one scandir walk
+			for entry in _walk_wav_files(self.recordings_dir):
+				if entry.stat().st_mtime < cutoff_time:
+					os.unlink(entry.path)
 					cleaned_files += 1
 					
 			print(f"Cleaned up {cleaned_files} old recording files")
@@ -17,16 +17,23 @@ def install_dependencies():
 		"sounddevice>=0.4.6",
 		"soundfile>=0.12.1", 
 		"numpy>=1.21.0",
-		"scipy>=1.7.0"
+		"scipy>=1.7.0",
+		"numba>=0.56.0",
+		"ijson>=3.1",
+		"orjson>=3.6"
 	]
 	
-	for package in packages:
-		try:
-			subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+	# One pip run resolves and downloads everything together
+	try:
+		subprocess.check_call([
+			sys.executable, "-m", "pip", "install",
+			"--disable-pip-version-check", "--no-input", *packages
+		])
+		for package in packages:
 			print(f"✓ Installed {package}")
-		except subprocess.CalledProcessError as e:
-			print(f"✗ Failed to install {package}: {e}")
-			return False
+	except subprocess.CalledProcessError as e:
+		print(f"✗ Failed to install dependencies ({', '.join(packages)}): {e}")
+		return False
 	
 	print("Dependencies installed successfully!")
 	return True
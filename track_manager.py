@@ -3,23 +3,58 @@ Track Manager - Manages state of individual tracks
 UPDATED to include volume and FX settings
 """
 
+import logging
+import operator
+
+# Per-event state changes (fader moves, mute clicks) log at debug level - free when it's disabled
+log = logging.getLogger(__name__)
+
 class Track:
-	def __init__(self, number):
+	# Fixed attribute layout - no per-instance __dict__
+	__slots__ = ('number', '_on_change', 'is_armed', '_is_muted', 'volume', '_has_data', 'name')
+	
+	def __init__(self, number, on_change=None):
 		self.number = number
+		self._on_change = on_change  # Called with the track when playability-related state changes
 		self.is_armed = False
-		self.is_muted = False
+		self._is_muted = False
 		self.volume = 1.0
-		self.has_data = False
+		self._has_data = False
 		self.name = f"Track {number}"
 		# New properties for FX (not stored here, but tracked for UI)
 		
+	@property
+	def is_muted(self):
+		return self._is_muted
+		
+	@is_muted.setter
+	def is_muted(self, value):
+		self._is_muted = value
+		self._notify_change()
+		
+	@property
+	def has_data(self):
+		return self._has_data
+		
+	@has_data.setter
+	def has_data(self, value):
+		self._has_data = value
+		self._notify_change()
+		
+	def _notify_change(self):
+		"""Tell the owning manager that mute/arm/data state changed"""
+		if self._on_change is not None:
+			self._on_change(self)
+		
 	def arm(self):
 		"""Arm track for recording"""
 		self.is_armed = True
+		self._notify_change()
 		
 	def disarm(self):
 		"""Disarm track from recording"""
 		self.is_armed = False
+		self._notify_change()
 		
 	def toggle_mute(self):
 		"""Toggle mute state"""
@@ -48,41 +83,72 @@ class Track:
 class TrackManager:
 	def __init__(self, num_tracks=8):
 		self.num_tracks = num_tracks
-		self.tracks = {}
 		self.armed_track = None  # Only one track can be armed at a time
-		
-		# Initialize tracks
-		for i in range(1, num_tracks + 1):
-			self.tracks[i] = Track(i)
+		self._state_version = 0  # Bumped on any mute/arm/data change so readers can cache
+		# Bit n is track n - kept in step with the tracks by _on_track_change
+		self._has_data_mask = 0
+		self._muted_mask = 0
+		self._dirty_tracks = set()  # Tracks changed since the UI last took them
+		# Indexed by track number, slot 0 unused - get_track creates a track on first access,
+		# and a None slot is a track still in its default state
+		self.tracks = [None] * (num_tracks + 1)
 			
+	def _on_track_change(self, track):
+		"""Mirror a track's data/mute flags into the masks and invalidate cached playable-track lists"""
+		bit = 1 << track.number
+		self._has_data_mask = self._has_data_mask | bit if track.has_data else self._has_data_mask & ~bit
+		self._muted_mask = self._muted_mask | bit if track.is_muted else self._muted_mask & ~bit
+		self._state_version += 1
+		self._dirty_tracks.add(track.number)
+		
+	def take_dirty_tracks(self):
+		"""Return the tracks whose state changed since the last call, and reset the set"""
+		dirty = self._dirty_tracks
+		self._dirty_tracks = set()
+		return dirty
+		
 	def get_track(self, track_number):
-		"""Get track by number"""
-		return self.tracks.get(track_number)
+		"""Get track by number, creating it on first access"""
+		# operator.index also takes NumPy integers (from masks and arrays) and turns them into int
+		try:
+			track_number = operator.index(track_number)
+		except TypeError:
+			return None
+		if 1 <= track_number <= self.num_tracks:
+			track = self.tracks[track_number]
+			if track is None:
+				track = self.tracks[track_number] = Track(track_number, on_change=self._on_track_change)
+			return track
+		return None
 		
 	def arm_track(self, track_number):
 		"""Arm specific track for recording (disarms others)"""
 		# Disarm all tracks first
-		for track in self.tracks.values():
-			track.disarm()
+		for track in self.tracks[1:]:
+			if track is not None:
+				track.disarm()
 			
 		# Arm the selected track
-		if track_number in self.tracks:
-			self.tracks[track_number].arm()
+		track = self.get_track(track_number)
+		if track:
+			track.arm()
 			self.armed_track = track_number
-			print(f"Armed track {track_number}")
+			log.debug("Armed track %d", track_number)
+			
+			# Armed input needs a running stream for monitoring and recording
+			engine = getattr(self, '_audio_engine_ref', None)
+			if engine and (not engine.stream or not engine.stream.active):
+				engine.start_stream()
 			return True
 		return False
-
-		if hasattr(self, '_audio_engine_ref') and self._audio_engine_ref:
-			if not self._audio_engine_ref.stream or not self._audio_engine_ref.stream.active:
-				self._audio_engine_ref.start_stream()
 		
 	def disarm_all_tracks(self):
 		"""Disarm all tracks"""
-		for track in self.tracks.values():
-			track.disarm()
+		for track in self.tracks[1:]:
+			if track is not None:
+				track.disarm()
 		self.armed_track = None
-		print("Disarmed all tracks")
+		log.debug("Disarmed all tracks")
 		
 	def get_armed_track(self):
 		"""Get currently armed track number"""
@@ -90,27 +156,30 @@ class TrackManager:
 		
 	def toggle_track_mute(self, track_number):
 		"""Toggle mute for specific track"""
-		if track_number in self.tracks:
-			is_muted = self.tracks[track_number].toggle_mute()
-			print(f"Track {track_number} {'muted' if is_muted else 'unmuted'}")
+		track = self.get_track(track_number)
+		if track:
+			is_muted = track.toggle_mute()
+			log.debug("Track %d %s", track_number, 'muted' if is_muted else 'unmuted')
 			return is_muted
 		return False
 		
 	def set_track_volume(self, track_number, volume):
 		"""Set volume for specific track"""
-		if track_number in self.tracks:
-			self.tracks[track_number].set_volume(volume)
-			print(f"Track {track_number} volume set to {volume:.2f}")
+		track = self.get_track(track_number)
+		if track:
+			track.set_volume(volume)
+			log.debug("Track %d volume set to %.2f", track_number, volume)
 			
 	def mark_track_has_data(self, track_number, has_data=True):
 		"""Mark track as having recorded data"""
-		if track_number in self.tracks:
-			self.tracks[track_number].set_has_data(has_data)
+		track = self.get_track(track_number)
+		if track:
+			track.set_has_data(has_data)
 			
 	def clear_track(self, track_number):
 		"""Clear track data and reset state"""
-		if track_number in self.tracks:
-			track = self.tracks[track_number]
+		track = self.get_track(track_number)
+		if track:
 			track.set_has_data(False)
 			track.disarm()
 			track.is_muted = False
@@ -119,33 +188,40 @@ class TrackManager:
 			if self.armed_track == track_number:
 				self.armed_track = None
 				
-			print(f"Track {track_number} cleared and reset")
+			log.debug("Track %d cleared and reset", track_number)
 			
 	def get_playable_tracks(self):
 		"""Get list of tracks that should be played (considering mute only, no solo)"""
 		playable = []
 		
-		# Play all non-muted tracks that have data
-		for track_num, track in self.tracks.items():
-			if track.has_data and not track.is_muted:
-				playable.append(track_num)
+		# Play all non-muted tracks that have data, lowest track first
+		mask = self.get_playable_mask()
+		while mask:
+			lowest_bit = mask & -mask
+			playable.append(lowest_bit.bit_length() - 1)
+			mask ^= lowest_bit
 					
 		return playable
 		
+	def get_playable_mask(self):
+		"""Bitmask of non-muted tracks with data - bit n is track n"""
+		return self._has_data_mask & ~self._muted_mask
+		
 	def get_all_track_states(self):
 		"""Get state of all tracks"""
-		return {num: track.get_state() for num, track in self.tracks.items()}
+		return {num: self.get_track(num).get_state() for num in range(1, self.num_tracks + 1)}
 		
 	def has_any_data(self):
 		"""Check if any track has recorded data"""
-		return any(track.has_data for track in self.tracks.values())
+		return self._has_data_mask != 0
 		
 	def get_tracks_with_data(self):
 		"""Get list of track numbers that have data"""
-		return [num for num, track in self.tracks.items() if track.has_data]
+		return [track.number for track in self.tracks[1:] if track is not None and track.has_data]
 		
 	def reset_all_tracks(self):
 		"""Reset all tracks to default state"""
-		for track_num in self.tracks.keys():
-			self.clear_track(track_num)
-		print("All tracks reset")
\ No newline at end of file
+		for track in self.tracks[1:]:
+			if track is not None:
+				self.clear_track(track.number)
+		log.debug("All tracks reset")
\ No newline at end of file
@@ -5,12 +5,96 @@ UPDATED VERSION with volume faders and FX controls - FIXED layout issues
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+from tkinter import font as tkfont
 import threading
 import time
-import math
+import logging
+import queue
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
+# Per-track sync/cache chatter logs at debug level - free when it's disabled
+log = logging.getLogger(__name__)
+
+# Track button colors - module constants so the per-tick state updates skip the self.colors lookups
+FG_TEXT = '#ffffff'
+BG_NORMAL = '#2F4F4F'
+BG_ARMED = '#cc4444'
+BG_MUTED = '#888888'
+BG_DISABLED = '#666666'
+
+# Track strip state bits - update_track_ui_optimized packs the audio version above them
+STATE_ARMED = 1
+STATE_MUTED = 2
+STATE_HAS_DATA = 4
+STATE_PLAYING = 8
+STATE_RECORDING = 16
+STATE_VERSION_SHIFT = 5
+
+def master_gain_for_percent(volume_percent):
+	"""Master fader position (0-100) to linear gain - 75% is 0 dB"""
+	if volume_percent == 0:
+		return 0.001  # Essentially muted
+	elif volume_percent <= 75:
+		# 0% to 75% maps to -60dB to 0dB
+		db_value = -60.0 + (volume_percent / 75.0) * 60.0
+	else:
+		# 75% to 100% maps to 0dB to +9dB
+		db_value = ((volume_percent - 75.0) / 25.0) * 9.0
+	return 10.0 ** (db_value / 20.0)
+
+# The master Scale steps in whole percents, so its whole range is tabulated once
+MASTER_GAIN_TABLE = tuple(master_gain_for_percent(p) for p in range(101))
+
+# "MM:SS." prefixes for the first three hours, indexed by whole seconds
+TIME_PREFIX_TABLE = tuple(f"{m:02d}:{s:02d}." for m in range(180) for s in range(60))
+
+@lru_cache(maxsize=8)
+def _waveform_grid(width, height):
+	"""Row distances from the center line and brace/space byte layout for one image size"""
+	distance = np.abs(np.arange(height) - height // 2)[:, None]
+	# Each row of put() data is '{' + width space-terminated color tokens + '} '
+	return distance, np.frombuffer(b'{', np.uint8), np.frombuffer(b'} ', np.uint8)
+
+@lru_cache(maxsize=8)
+def _waveform_tokens(background):
+	"""Space-padded byte tokens for unlit and lit pixels, both the same length"""
+	size = max(len(background), len('#00ff88')) + 1
+	return np.frombuffer(background.ljust(size).encode() + '#00ff88'.ljust(size).encode(), np.uint8).reshape(2, size)
+
+def build_waveform_image_data(envelope, width, height, background):
+	"""PhotoImage.put() data for a per-column RMS envelope - pure numpy/string work, safe off the Tk thread"""
+	columns = len(envelope)
+	
+	# Normalize to canvas height
+	max_level = envelope.max() if envelope.max() > 0 else 1
+	center_y = height // 2
+	
+	# Light every pixel within each column's envelope - short takes still span the full width
+	levels = envelope[np.arange(width) * columns // width]
+	y_offset = (levels / max_level) * (center_y - 2)
+	distance, open_brace, close_brace = _waveform_grid(width, height)
+	lit = distance <= y_offset
+	
+	# Assemble the put() text as one byte array instead of joining a string per pixel
+	pixels = _waveform_tokens(background)[lit.view(np.uint8)].reshape(height, -1)
+	rows = np.concatenate((np.broadcast_to(open_brace, (height, 1)), pixels,
+		np.broadcast_to(close_brace, (height, 2))), axis=1)
+	return rows.tobytes().decode()
+
 class MultitrackUI:
+	# Redraw rate caps - updates in between are dropped, the next redraw shows the latest state
+	LEVEL_HZ = 20
+	WAVEFORM_HZ = 5
+	
+	# Lit color per meter segment (green to 70%, yellow to 90%, red above) and the unlit color
+	SEGMENT_COLORS = tuple(
+		'#00ff00' if i < 8 * 0.7 else '#ffff00' if i < 8 * 0.9 else '#ff0000'
+		for i in range(8)
+	)
+	SEGMENT_OFF_COLOR = '#333333'
+	
 	def __init__(self, root, audio_engine, track_manager, project_manager):
 		self.root = root
 		self.audio_engine = audio_engine
@@ -23,40 +107,69 @@ class MultitrackUI:
 		self.current_time = 0
 		
 		# Performance optimization caches
-		self._level_cache = {}
-		self._cursor_cache = {}
-		self._waveform_cache = set()
-		self._segment_cache = {}
-		self._last_update_state = {}
+		# Lit segment count and peak state each meter currently shows, by track number (-1 = never drawn)
+		self._drawn_segments = np.full(9, -1, dtype=np.int64)
+		self._drawn_peaks = np.zeros(9, dtype=bool)
+		self._cursor_x = [-999.0] * 9  # Last drawn playback cursor x per track
+		self._cursor_scales = [0.0] * 9  # Waveform pixels per sample per track, set when its audio changes
+		# Waveform state by track number - None when there is none
+		self._waveform_versions = [None] * 9  # Audio version each canvas currently shows
+		self._waveform_images = [None] * 9  # (render key, PhotoImage)
+		self._waveform_jobs = [None] * 9  # Render key being built on the waveform pool
+		self._waveform_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='waveform')
+		self._track_ui_states = [-1] * 9  # Last drawn state bits per track - -1 forces a full refresh
+		self._track_ui_names = [None] * 9  # Last drawn track name per track
+		self._dirty_tracks = set(range(1, 9))  # Strips the next UI tick refreshes
+		self._last_transport = None  # (is_playing, is_recording) the strips were last refreshed for
+		self._last_time_text = None
+		self._next_level_redraw = [0.0] * 9  # time.monotonic() before which a meter isn't redrawn
+		self._next_waveform_redraw = [0.0] * 9
+		self._pending_waveforms = set()  # Tracks whose waveform is waiting for its redraw slot
+		self._pending_volumes = {}  # track -> fader volume not yet applied
+		self._fx_menu_positions = {}  # track -> screen (x, y) under its FX button, dropped on any move/resize
+		self._load_dialog = None  # Load Project dialog, built on first use and withdrawn when closed
+		self._load_listbox = None
+		self._load_projects = []  # Project entries in listbox order
+		self._input_device_names = None  # Names last given to the device combo boxes
+		self._output_device_names = None
 		
 		# Color scheme - updated with teal theme
 		self.colors = {
 			'bg': '#008080',  # Main teal background
-			'fg': '#ffffff',  # White text
+			'fg': FG_TEXT,  # White text
 			'upper_bg': '#2F4F4F',  # Dark teal for upper windows
-			'button_normal': '#2F4F4F',  # Dark teal for buttons
+			'button_normal': BG_NORMAL,  # Dark teal for buttons
 			'button_active': '#4682B4',  # Steel blue for active buttons
-			'button_armed': '#cc4444',  # Keep red for armed
+			'button_armed': BG_ARMED,  # Keep red for armed
 			'button_recording': '#ff0000',  # Keep red for recording
 			'button_playing': '#44cc44',  # Keep green for playing
-			'button_muted': '#888888',  # Keep gray for muted
-			'button_disabled': '#666666',  # Keep gray for disabled
+			'button_muted': BG_MUTED,  # Keep gray for muted
+			'button_disabled': BG_DISABLED,  # Keep gray for disabled
 			'text': '#ffffff',
 			'fx_button': '#8A2BE2',  # Purple for FX buttons
 			'fx_active': '#9932CC'   # Darker purple for active FX
 		}
 		
 		# Track UI elements storage
-		self.track_widgets = {}
+		self.track_widgets = [None] * 9  # Widget dict per track number - slot 0 is unused
 		self.volume_faders = {}  # Store volume fader references
 		self.fx_buttons = {}     # Store FX button references
 		self.track_name_labels = {}  # Store track name labels for faders
 		
+		# Named fonts ('Arial12Bold', 'Arial10', ...) - Tk parses each spec once and every widget shares it
+		self._fonts = [
+			tkfont.Font(root=self.root, name=f'Arial{size}Bold', family='Arial', size=size, weight='bold')
+			for size in (6, 8, 9, 10, 11, 12, 14, 16, 20)
+		] + [
+			tkfont.Font(root=self.root, name=f'Arial{size}', family='Arial', size=size)
+			for size in (8, 9, 10, 12)
+		]
+		
 		# Get project name before creating UI
 		self.get_project_name_at_startup()
 		
 		self.create_ui()
-		self.start_optimized_ui_update_thread()
+		self.start_ui_update_loop()
 
 		self.audio_engine.set_master_volume(1.0)  # 75% = 0 dB
 		
@@ -90,7 +203,7 @@ class MultitrackUI:
 		tk.Label(
 			project_frame,
 			text="Current Project:",
-			font=('Arial', 14, 'bold'),
+			font='Arial14Bold',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		).pack(side='left', padx=(0, 10))
@@ -99,7 +212,7 @@ class MultitrackUI:
 		self.project_name_display = tk.Label(
 			project_frame,
 			text=self.project_manager.current_project_name,
-			font=('Arial', 14, 'bold'),
+			font='Arial14Bold',
 			bg='#404040',
 			fg='#ffffff',
 			relief='sunken',
@@ -114,7 +227,7 @@ class MultitrackUI:
 			project_frame,
 			text="NEW PROJECT",
 			command=self.new_project,
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg=self.colors['button_normal'],
 			fg=self.colors['fg'],
 			activebackground=self.colors['button_active'],
@@ -128,7 +241,7 @@ class MultitrackUI:
 			project_frame,
 			text="SAVE PROJECT",
 			command=self.save_project,
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg=self.colors['button_normal'],
 			fg=self.colors['fg'],
 			activebackground=self.colors['button_active'],
@@ -142,7 +255,7 @@ class MultitrackUI:
 			project_frame,
 			text="LOAD PROJECT",
 			command=self.load_project,
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg=self.colors['button_normal'],
 			fg=self.colors['fg'],
 			activebackground=self.colors['button_active'],
@@ -156,7 +269,7 @@ class MultitrackUI:
 			project_frame,
 			text="EXPORT MP3",
 			command=self.export_mixdown,
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg='#4169E1',  # Royal blue for export
 			fg=self.colors['fg'],
 			activebackground='#6495ED',
@@ -177,7 +290,7 @@ class MultitrackUI:
 		tk.Label(
 			input_frame,
 			text="Input Device:",
-			font=('Arial', 10, 'bold'),
+			font='Arial10Bold',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		).pack(anchor='w')
@@ -188,7 +301,7 @@ class MultitrackUI:
 			textvariable=self.input_device_var,
 			state='readonly',
 			width=40,
-			font=('Arial', 9)
+			font='Arial9'
 		)
 		self.input_device_combo.pack()
 		self.input_device_combo.bind('<<ComboboxSelected>>', self.on_input_device_change)
@@ -200,7 +313,7 @@ class MultitrackUI:
 		tk.Label(
 			output_frame,
 			text="Output Device:",
-			font=('Arial', 10, 'bold'),
+			font='Arial10Bold',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		).pack(anchor='w')
@@ -211,7 +324,7 @@ class MultitrackUI:
 			textvariable=self.output_device_var,
 			state='readonly',
 			width=40,
-			font=('Arial', 9)
+			font='Arial9'
 		)
 		self.output_device_combo.pack()
 		self.output_device_combo.bind('<<ComboboxSelected>>', self.on_output_device_change)
@@ -232,7 +345,7 @@ class MultitrackUI:
 			latency_frame,
 			text="RECALIBRATE",
 			command=self.recalibrate_latency,
-			font=('Arial', 9, 'bold'),
+			font='Arial9Bold',
 			bg=self.colors['button_normal'],
 			fg=self.colors['fg'],
 			activebackground=self.colors['button_active'],
@@ -246,19 +359,20 @@ class MultitrackUI:
 		self.latency_label = tk.Label(
 			latency_frame,
 			text="Measuring latency...",
-			font=('Arial', 9),
+			font='Arial9',
 			bg=self.colors['upper_bg'],
 			fg='#cccccc'
 		)
 		self.latency_label.pack(side='left')
 		
-		# Update latency info periodically
+		# Show the current state - later changes arrive as 'latency' events on the UI queue
 		self.update_latency_info()
 		
-	def update_latency_info(self):
+	def update_latency_info(self, latency_info=None):
 		"""Update latency information display"""
 		try:
-			latency_info = self.audio_engine.get_latency_info()
+			if latency_info is None:
+				latency_info = self.audio_engine.get_latency_info()
 			if latency_info['calibrated']:
 				status = f"✓ Latency: {latency_info['measured_ms']:.1f}ms (compensated)"
 				color = '#90EE90'  # Light green
@@ -270,9 +384,6 @@ class MultitrackUI:
 		except:
 			pass
 		
-		# Update every 5 seconds
-		self.root.after(5000, self.update_latency_info)
-		
 	def create_ui(self):
 		"""Create the main UI layout"""
 		self.create_project_controls()
@@ -282,6 +393,7 @@ class MultitrackUI:
 		self.create_metronome_controls()
 		self.create_volume_faders()  # New volume faders section
 		self.setup_focus_handling()
+		self.root.bind('<Configure>', self.on_root_configure, add='+')
 		
 	def create_top_controls(self):
 		"""Create main transport controls"""
@@ -290,7 +402,7 @@ class MultitrackUI:
 		
 		# Main transport buttons
 		button_style = {
-			'font': ('Arial', 16, 'bold'),
+			'font': 'Arial16Bold',
 			'width': 8,
 			'height': 2,
 			'bg': self.colors['button_normal'],
@@ -320,7 +432,7 @@ class MultitrackUI:
 		instruction_label = tk.Label(
 			top_frame,
 			text="ARM a track, then press PLAY to record.",
-			font=('Arial', 12),
+			font='Arial12',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		)
@@ -330,7 +442,7 @@ class MultitrackUI:
 		self.time_label = tk.Label(
 			top_frame,
 			text="00:00.000",
-			font=('Arial', 20, 'bold'),
+			font='Arial20Bold',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		)
@@ -348,7 +460,6 @@ class MultitrackUI:
 		track_frame = tk.Frame(track_canvas, bg=self.colors['bg'])
 		
 		track_canvas.pack(fill='x', anchor='w', expand=False, padx=(20, 620), pady=10)
-		track_canvas.create_window((0, 0), window=track_frame, anchor='nw')
 		
 		# Track headers with dark teal background
 		header_frame = tk.Frame(track_frame, bg='#2F4F4F')
@@ -362,7 +473,7 @@ class MultitrackUI:
 			tk.Label(
 				header_frame,
 				text=header,
-				font=('Arial', 12, 'bold'),
+				font='Arial12Bold',
 				bg='#2F4F4F',
 				fg=self.colors['fg'],
 				width=width
@@ -372,13 +483,16 @@ class MultitrackUI:
 		for track_num in range(1, 9):
 			self.create_track_strip(track_frame, track_num)
 			
+		# Embed the frame only once it's fully built so the canvas lays it out in a single pass
+		track_canvas.create_window((0, 0), window=track_frame, anchor='nw')
+			
 	def create_track_strip(self, parent, track_num):
 		"""Create a single track strip with controls"""
 		track_frame = tk.Frame(parent, relief='ridge', bd=2, bg='#2F4F4F')
 		track_frame.pack(fill='x', pady=2)
 		
 		button_style = {
-			'font': ('Arial', 12, 'bold'),
+			'font': 'Arial12Bold',
 			'width': 6,
 			'height': 1,
 			'relief': 'raised',
@@ -390,7 +504,7 @@ class MultitrackUI:
 		track_name_entry = tk.Entry(
 			track_frame,
 			textvariable=track_name_var,
-			font=('Arial', 11, 'bold'),
+			font='Arial11Bold',
 			bg='#404040',
 			fg=self.colors['fg'],
 			insertbackground=self.colors['fg'],
@@ -400,8 +514,10 @@ class MultitrackUI:
 			relief='sunken'
 		)
 		track_name_entry.pack(side='left', padx=5)
-		track_name_entry.bind('<Return>', lambda e: self.on_track_name_change(track_num, track_name_var.get()))
-		track_name_entry.bind('<FocusOut>', lambda e: self.on_track_name_change(track_num, track_name_var.get()))
+		# One shared handler for every strip - the entry carries its own track number
+		track_name_entry.track_num = track_num
+		track_name_entry.bind('<Return>', self.on_track_name_event)
+		track_name_entry.bind('<FocusOut>', self.on_track_name_event)
 		
 		# Level meter frame
 		level_frame = tk.Frame(track_frame, width=60, height=30, bg='#2F4F4F')
@@ -418,11 +534,28 @@ class MultitrackUI:
 		)
 		level_canvas.pack(padx=5, pady=2)
 		
+		# Segments are created once - meter updates only recolor them
+		segment_width = 48 / 8
+		level_segments = [
+			level_canvas.create_rectangle(
+				1 + i * segment_width, 2, i * segment_width + segment_width, 18,
+				fill='#333333', outline='#666666'
+			)
+			for i in range(8)
+		]
+		
+		# Tcl recolor command per segment, lit and unlit - meter redraws only pick from these
+		level_path = str(level_canvas)
+		level_commands = (
+			tuple(f"{level_path} itemconfigure {segment} -fill {color}" for segment, color in zip(level_segments, self.SEGMENT_COLORS)),
+			tuple(f"{level_path} itemconfigure {segment} -fill {self.SEGMENT_OFF_COLOR}" for segment in level_segments)
+		)
+		
 		# Peak indicator
 		peak_indicator = tk.Label(
 			level_frame,
 			text="PEAK",
-			font=('Arial', 6, 'bold'),
+			font='Arial6Bold',
 			bg='#2F4F4F',
 			fg='#333333',
 			width=8
@@ -433,7 +566,7 @@ class MultitrackUI:
 		arm_button = tk.Button(
 			track_frame,
 			text="ARM",
-			command=lambda: self.toggle_arm(track_num),
+			command=partial(self.toggle_arm, track_num),
 			bg=self.colors['button_normal'],
 			fg=self.colors['fg'],
 			activebackground=self.colors['button_active'],
@@ -445,7 +578,7 @@ class MultitrackUI:
 		mute_button = tk.Button(
 			track_frame,
 			text="MUTE",
-			command=lambda: self.toggle_mute(track_num),
+			command=partial(self.toggle_mute, track_num),
 			bg=self.colors['button_normal'],
 			fg=self.colors['fg'],
 			activebackground=self.colors['button_active'],
@@ -457,7 +590,7 @@ class MultitrackUI:
 		clear_button = tk.Button(
 			track_frame,
 			text="CLEAR",
-			command=lambda: self.clear_track(track_num),
+			command=partial(self.clear_track, track_num),
 			bg=self.colors['button_normal'],
 			fg=self.colors['fg'],
 			activebackground=self.colors['button_active'],
@@ -469,7 +602,7 @@ class MultitrackUI:
 		status_label = tk.Label(
 			track_frame,
 			text="Empty",
-			font=('Arial', 10),
+			font='Arial10',
 			bg='#2F4F4F',
 			fg=self.colors['fg'],
 			width=13,
@@ -492,6 +625,9 @@ class MultitrackUI:
 		)
 		waveform_canvas.pack(padx=10, pady=2)
 		
+		# Playback cursor lives for the strip's lifetime - parked off-canvas when not playing
+		cursor_id = waveform_canvas.create_line(-5, 0, -5, 35, fill='#ffffff', width=2, tags='cursor')
+		
 		# Store references to track widgets
 		self.track_widgets[track_num] = {
 			'frame': track_frame,
@@ -502,8 +638,10 @@ class MultitrackUI:
 			'clear_button': clear_button,
 			'status_label': status_label,
 			'level_canvas': level_canvas,
+			'level_commands': level_commands,
 			'peak_indicator': peak_indicator,
-			'waveform_canvas': waveform_canvas
+			'waveform_canvas': waveform_canvas,
+			'cursor_id': cursor_id
 		}
 		
 	def create_metronome_controls(self):
@@ -515,7 +653,7 @@ class MultitrackUI:
 		tk.Label(
 			metronome_frame,
 			text="METRONOME",
-			font=('Arial', 14, 'bold'),
+			font='Arial14Bold',
 			bg=self.colors['bg'],
 			fg=self.colors['fg']
 		).pack(side='left', padx=10)
@@ -525,7 +663,7 @@ class MultitrackUI:
 			metronome_frame,
 			text="OFF",
 			command=self.toggle_metronome,
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			width=6,
 			height=1,
 			bg=self.colors['button_normal'],
@@ -540,7 +678,7 @@ class MultitrackUI:
 		tk.Label(
 			metronome_frame,
 			text="VOL:",
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg=self.colors['bg'],
 			fg=self.colors['fg']
 		).pack(side='left', padx=(20, 5))
@@ -565,7 +703,7 @@ class MultitrackUI:
 		tk.Label(
 			metronome_frame,
 			text="BPM:",
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg=self.colors['bg'],
 			fg=self.colors['fg']
 		).pack(side='left', padx=(20, 5))
@@ -575,7 +713,7 @@ class MultitrackUI:
 		self.bpm_entry = tk.Entry(
 			metronome_frame,
 			textvariable=self.bpm_var,
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg='#404040',
 			fg=self.colors['fg'],
 			insertbackground=self.colors['fg'],
@@ -590,7 +728,7 @@ class MultitrackUI:
 		
 		# BPM adjustment buttons (single click only)
 		bpm_button_style = {
-			'font': ('Arial', 12, 'bold'),
+			'font': 'Arial12Bold',
 			'width': 3,
 			'height': 1,
 			'bg': self.colors['button_normal'],
@@ -618,7 +756,7 @@ class MultitrackUI:
 		tk.Label(
 			metronome_frame,
 			text="MASTER VOLUME:",
-			font=('Arial', 12, 'bold'),
+			font='Arial12Bold',
 			bg=self.colors['bg'],
 			fg=self.colors['fg']
 		).pack(side='left', padx=(30, 5))
@@ -650,7 +788,7 @@ class MultitrackUI:
 		title_label = tk.Label(
 			faders_main_frame,
 			text="TRACK VOLUMES & EFFECTS",
-			font=('Arial', 14, 'bold'),
+			font='Arial14Bold',
 			bg=self.colors['bg'],
 			fg=self.colors['fg']
 		)
@@ -688,7 +826,7 @@ class MultitrackUI:
 		track_name_label = tk.Label(
 			cell_frame,
 			text=track_name,
-			font=('Arial', 10, 'bold'),
+			font='Arial10Bold',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg'],
 			anchor='w'
@@ -699,8 +837,8 @@ class MultitrackUI:
 		fx_button = tk.Button(
 			cell_frame,
 			text="FX",
-			command=lambda: self.show_fx_menu(track_num),
-			font=('Arial', 9, 'bold'),
+			command=partial(self.show_fx_menu, track_num),
+			font='Arial9Bold',
 			width=6,
 			height=1,
 			bg=self.colors['fx_button'],
@@ -710,6 +848,9 @@ class MultitrackUI:
 			bd=2
 		)
 		fx_button.pack(side='left', pady=(5, 5))
+		# Shared <Configure> handler, like the name entry's - the button carries its track number
+		fx_button.track_num = track_num
+		fx_button.bind('<Configure>', self.on_fx_button_configure)
 		
 		# Volume controls at bottom
 		volume_frame = tk.Frame(cell_frame, bg=self.colors['upper_bg'])
@@ -719,7 +860,7 @@ class MultitrackUI:
 		tk.Label(
 			volume_frame,
 			text="VOL:",
-			font=('Arial', 8, 'bold'),
+			font='Arial8Bold',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		).pack(side='left')
@@ -737,9 +878,9 @@ class MultitrackUI:
 			highlightthickness=0,
 			troughcolor='#404040',
 			activebackground=self.colors['button_active'],
-			command=lambda val, tn=track_num: self.on_volume_change(tn, val),
+			command=partial(self.on_volume_change, track_num),
 			showvalue=True,
-			font=('Arial', 8)
+			font='Arial8'
 		)
 		volume_fader.set(75)  # Default to 75%
 		volume_fader.pack(pady=(0, 3))
@@ -762,7 +903,7 @@ class MultitrackUI:
 		# None option
 		fx_menu.add_command(
 			label="None" + (" ✓" if current_fx == "none" else ""),
-			command=lambda: self.set_track_fx(track_num, "none")
+			command=partial(self.set_track_fx, track_num, "none")
 		)
 		
 		fx_menu.add_separator()
@@ -770,27 +911,38 @@ class MultitrackUI:
 		# Wide Hall preset
 		fx_menu.add_command(
 			label="Wide Hall" + (" ✓" if current_fx == "wide_hall" else ""),
-			command=lambda: self.set_track_fx(track_num, "wide_hall")
+			command=partial(self.set_track_fx, track_num, "wide_hall")
 		)
 		
 		# Studio preset  
 		fx_menu.add_command(
 			label="Studio" + (" ✓" if current_fx == "studio" else ""),
-			command=lambda: self.set_track_fx(track_num, "studio")
+			command=partial(self.set_track_fx, track_num, "studio")
 		)
 		
 		# Compressor only preset
 		fx_menu.add_command(
 			label="Compressor" + (" ✓" if current_fx == "compressor" else ""),
-			command=lambda: self.set_track_fx(track_num, "compressor")
+			command=partial(self.set_track_fx, track_num, "compressor")
 		)
 		
-		# Get button position for menu placement
-		fx_button = self.fx_buttons[track_num]
-		x = fx_button.winfo_rootx()
-		y = fx_button.winfo_rooty() + fx_button.winfo_height()
+		# Get button position for menu placement - measured once until the button or window moves
+		position = self._fx_menu_positions.get(track_num)
+		if position is None:
+			fx_button = self.fx_buttons[track_num]
+			position = (fx_button.winfo_rootx(), fx_button.winfo_rooty() + fx_button.winfo_height())
+			self._fx_menu_positions[track_num] = position
+		
+		fx_menu.post(*position)
+		
+	def on_fx_button_configure(self, event):
+		"""FX button <Configure> handler shared by all strips - its cached menu position is stale"""
+		self._fx_menu_positions.pop(event.widget.track_num, None)
 		
-		fx_menu.post(x, y)
+	def on_root_configure(self, event):
+		"""Window moved or resized - screen positions of the FX buttons are stale"""
+		if event.widget is self.root:
+			self._fx_menu_positions.clear()
 	
 	def set_track_fx(self, track_num, fx_type):
 		"""Set FX for a track"""
@@ -803,13 +955,21 @@ class MultitrackUI:
 		else:
 			fx_button.config(bg=self.colors['fx_active'])
 			
-		print(f"Set track {track_num} FX to: {fx_type}")
+		log.debug("Set track %d FX to: %s", track_num, fx_type)
 	
 	def on_volume_change(self, track_num, value):
-		"""Handle volume fader change"""
-		volume = float(value) / 100.0  # Convert to 0.0-1.0 range
-		self.audio_engine.set_track_volume(track_num, volume)
-		self.track_manager.set_track_volume(track_num, volume)
+		"""Handle volume fader change - a drag's burst of values is applied at most every 20ms"""
+		first = track_num not in self._pending_volumes
+		self._pending_volumes[track_num] = float(value) / 100.0  # Convert to 0.0-1.0 range
+		if first:
+			self.root.after(20, self._apply_pending_volume, track_num)
+			
+	def _apply_pending_volume(self, track_num):
+		"""Apply the latest fader value for a track"""
+		volume = self._pending_volumes.pop(track_num, None)
+		if volume is not None:
+			self.audio_engine.set_track_volume(track_num, volume)
+			self.track_manager.set_track_volume(track_num, volume)
 		
 	def recalibrate_latency(self):
 		"""Manually recalibrate audio latency with blocking popup"""
@@ -832,7 +992,7 @@ class MultitrackUI:
 		tk.Label(
 			self.calibration_popup,
 			text="Recalibrating...",
-			font=('Arial', 14, 'bold'),
+			font='Arial14Bold',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		).pack(pady=20)
@@ -840,23 +1000,20 @@ class MultitrackUI:
 		tk.Label(
 			self.calibration_popup,
 			text="Please wait while audio latency is measured.",
-			font=('Arial', 10),
+			font='Arial10',
 			bg=self.colors['upper_bg'],
 			fg=self.colors['fg']
 		).pack(pady=10)
 	
-		# Update display
-		self.calibration_popup.update()
-	
 		def calibration_thread():
 			try:
 				# Run latency measurement
 				self.audio_engine.measure_latency()
 			
 				# Close popup and update display in main thread
-				self.root.after(0, self.calibration_complete)
+				self.post_to_ui(self.calibration_complete)
 			except Exception as e:
-				self.root.after(0, lambda: self.calibration_error(str(e)))
+				self.post_to_ui(lambda: self.calibration_error(str(e)))
 	
 		# Run calibration in background thread
 		threading.Thread(target=calibration_thread, daemon=True).start()
@@ -900,24 +1057,22 @@ class MultitrackUI:
 			progress_label = tk.Label(
 				progress_window,
 				text="Creating MP3 mixdown...",
-				font=('Arial', 12),
+				font='Arial12',
 				bg=self.colors['upper_bg'],
 				fg=self.colors['fg']
 			)
 			progress_label.pack(pady=30)
 			
-			progress_window.update()
-			
 			# Export in a separate thread to avoid UI blocking
 			def export_thread():
 				try:
 					success = self.audio_engine.export_mixdown_mp3(project_name)
 					
 					# Update UI in main thread
-					self.root.after(0, lambda: self.export_complete(progress_window, success, project_name))
+					self.post_to_ui(lambda: self.export_complete(progress_window, success, project_name))
 					
 				except Exception as e:
-					self.root.after(0, lambda: self.export_error(progress_window, str(e)))
+					self.post_to_ui(lambda: self.export_error(progress_window, str(e)))
 			
 			threading.Thread(target=export_thread, daemon=True).start()
 			
@@ -1013,7 +1168,7 @@ class MultitrackUI:
 			if track:
 				track.name = f"Track {track_num}"
 			
-			widgets = self.track_widgets.get(track_num)
+			widgets = self.track_widgets[track_num]
 			if widgets:
 				widgets['track_name_var'].set(f"Track {track_num}")
 	
@@ -1036,6 +1191,10 @@ class MultitrackUI:
 		print(f"✓ Created new project: {new_project_name}")
 		print("✓ All parameters reset to defaults")
 		
+	def on_track_name_event(self, event):
+		"""Track name Entry <Return>/<FocusOut> handler shared by all strips"""
+		self.on_track_name_change(event.widget.track_num, event.widget.get())
+		
 	def on_track_name_change(self, track_num, new_name):
 		"""Handle track name change from Entry widget"""
 		if new_name.strip():
@@ -1046,26 +1205,15 @@ class MultitrackUI:
 				if track_num in self.track_name_labels:
 					self.track_name_labels[track_num].config(text=track.name)
 				# Force UI state update
-				state_key = f'track_{track_num}_state'
-				if state_key in self._last_update_state:
-					del self._last_update_state[state_key]
+				self.invalidate_track_ui(track_num)
 		
 	def on_master_volume_change(self, value):
 		"""Handle master volume change with dB calculation"""
 		volume_percent = float(value)
-	
-		# Calculate dB value based on position
-		if volume_percent == 0:
-			db_value = -60.0
-			linear_gain = 0.001  # Essentially muted
-		elif volume_percent <= 75:
-			# 0% to 75% maps to -60dB to 0dB
-			db_value = -60.0 + (volume_percent / 75.0) * 60.0
-			linear_gain = 10.0 ** (db_value / 20.0)
+		if volume_percent.is_integer() and 0 <= volume_percent <= 100:
+			linear_gain = MASTER_GAIN_TABLE[int(volume_percent)]
 		else:
-			# 75% to 100% maps to 0dB to +9dB
-			db_value = ((volume_percent - 75.0) / 25.0) * 9.0
-			linear_gain = 10.0 ** (db_value / 20.0)
+			linear_gain = master_gain_for_percent(volume_percent)
 	
 		# Update audio engine
 		self.audio_engine.set_master_volume(linear_gain)
@@ -1103,11 +1251,16 @@ class MultitrackUI:
 		input_devices = self.audio_engine.get_input_devices()
 		output_devices = self.audio_engine.get_output_devices()
 	
-		input_names = [f"{dev['name']}" for dev in input_devices]
-		output_names = [f"{dev['name']}" for dev in output_devices]
+		input_names = tuple(f"{dev['name']}" for dev in input_devices)
+		output_names = tuple(f"{dev['name']}" for dev in output_devices)
 	
-		self.input_device_combo['values'] = input_names
-		self.output_device_combo['values'] = output_names
+		# Only hand Tk a new list when the devices actually changed
+		if input_names != self._input_device_names:
+			self._input_device_names = input_names
+			self.input_device_combo['values'] = input_names
+		if output_names != self._output_device_names:
+			self._output_device_names = output_names
+			self.output_device_combo['values'] = output_names
 	
 		# Select currently used devices by the audio engine
 		try:
@@ -1129,13 +1282,16 @@ class MultitrackUI:
 						output_selection = i
 						break
 		
+			# Apply (and restart the stream) only when the selection differs from what the engine uses
 			if input_names:
 				self.input_device_combo.current(input_selection)
-				self.on_input_device_change()
+				if input_devices[input_selection]['index'] != current_input_idx:
+					self.on_input_device_change()
 			
 			if output_names:
 				self.output_device_combo.current(output_selection)
-				self.on_output_device_change()
+				if output_devices[output_selection]['index'] != current_output_idx:
+					self.on_output_device_change()
 			
 		except Exception as e:
 			print(f"Error setting current devices: {e}")
@@ -1222,132 +1378,122 @@ class MultitrackUI:
 			messagebox.showinfo("No Projects", "No saved projects found.")
 			return
 			
-		# Create selection dialog
+		# The dialog is built once and only hidden between uses
+		if self._load_dialog is None or not self._load_dialog.winfo_exists():
+			self._build_load_dialog()
+			
+		self._load_projects = projects
+		self._load_listbox.delete(0, tk.END)
+		self._load_listbox.insert(tk.END, *[project['name'] for project in projects])  # One Tk call for the whole list
+		
+		self._load_dialog.deiconify()
+		self._load_dialog.lift()
+		self._load_dialog.grab_set()
+		
+	def _build_load_dialog(self):
+		"""Create the (hidden) Load Project dialog"""
 		dialog = tk.Toplevel(self.root)
+		dialog.withdraw()
 		dialog.title("Load Project")
 		dialog.geometry("400x300")
 		dialog.configure(bg=self.colors['upper_bg'])
 		dialog.transient(self.root)
-		dialog.grab_set()
+		dialog.protocol("WM_DELETE_WINDOW", self.hide_load_dialog)
 		
-		tk.Label(dialog, text="Select Project to Load:", font=('Arial', 12, 'bold'), 
+		tk.Label(dialog, text="Select Project to Load:", font='Arial12Bold', 
 				bg=self.colors['upper_bg'], fg=self.colors['fg']).pack(pady=10)
 		
-		listbox = tk.Listbox(dialog, font=('Arial', 10), height=10)
-		for project in projects:
-			display_text = f"{project['name']}"
-			listbox.insert(tk.END, display_text)
+		listbox = tk.Listbox(dialog, font='Arial10', height=10)
 		listbox.pack(pady=10, padx=20, fill='both', expand=True)
 		
 		button_frame = tk.Frame(dialog, bg=self.colors['upper_bg'])
 		button_frame.pack(pady=10)
 		
-		def on_load():
-			selection = listbox.curselection()
-			if selection:
-				selected_index = selection[0]
-				selected_project_data = projects[selected_index]
-		
-				# Load project metadata first
-				if self.project_manager.load_project(selected_project_data['file']):
-					# Load actual audio files first
-					self.audio_engine.load_project_audio_files(selected_project_data['name'])
-					
-					# Then apply project settings to managers
-					self.project_manager.apply_project_to_managers(self.track_manager, self.audio_engine)
-					
-					# Sync track states - make sure track manager knows which tracks have data
-					for track_num in range(1, 9):
-						track = self.track_manager.get_track(track_num)
-						if track:
-							has_audio_data = self.audio_engine.has_track_data(track_num)
-							track.set_has_data(has_audio_data)
-							if has_audio_data:
-								print(f"✓ Track {track_num} has audio data and is {'muted' if track.is_muted else 'unmuted'}")
-					
-					# Update recordings directory
-					recordings_folder = self.project_manager.set_project_name(selected_project_data['name'])
-					self.audio_engine.set_recordings_directory(recordings_folder)
-			
-					# Update UI
-					self.project_name_display.config(text=selected_project_data['name'])
-			
-					self.bpm_var.set(str(self.audio_engine.bpm))
-
-					# Update metronome button state
-					if self.audio_engine.metronome_enabled:
-						self.metronome_button.config(text="ON", bg=self.colors['button_playing'])
-					else:
-						self.metronome_button.config(text="OFF", bg=self.colors['button_normal'])
-			
-					# Update track names from loaded project
-					for track_num in range(1, 9):
-						track = self.track_manager.get_track(track_num)
-						widgets = self.track_widgets.get(track_num)
-						if track and widgets:
-							widgets['track_name_var'].set(track.name)
-			
-					# Update volume fader labels and values
-					self.update_track_name_labels()
-					for track_num in range(1, 9):
-						track = self.track_manager.get_track(track_num)
-						if track and track_num in self.volume_faders:
-							# Set fader to saved volume
-							self.volume_faders[track_num].set(int(track.volume * 100))
-			
-					# Update FX button states
-					for track_num in range(1, 9):
-						fx_type = self.audio_engine.get_track_fx(track_num)
-						if track_num in self.fx_buttons:
-							fx_button = self.fx_buttons[track_num]
-							if fx_type == "none":
-								fx_button.config(bg=self.colors['fx_button'])
-							else:
-								fx_button.config(bg=self.colors['fx_active'])
-			
-					# Clear ALL caches to force complete UI refresh
-					self.clear_ui_caches()
-			
-					# Force immediate UI update for all tracks
-					for track_num in range(1, 9):
-						self.update_track_ui_optimized(track_num)
-			
-					messagebox.showinfo("Project Loaded", f"Project '{selected_project_data['name']}' loaded successfully!")
-					dialog.destroy()
-				else:
-					messagebox.showerror("Load Error", "Failed to load project.")
-		def on_cancel():
-			dialog.destroy()
-		
-		tk.Button(button_frame, text="Load", command=on_load, **{
-			'font': ('Arial', 10, 'bold'), 'bg': self.colors['button_normal'], 
+		tk.Button(button_frame, text="Load", command=self.load_selected_project, **{
+			'font': 'Arial10Bold', 'bg': self.colors['button_normal'], 
 			'fg': self.colors['fg'], 'width': 8
 		}).pack(side='left', padx=5)
 		
-		tk.Button(button_frame, text="Cancel", command=on_cancel, **{
-			'font': ('Arial', 10, 'bold'), 'bg': self.colors['button_normal'], 
+		tk.Button(button_frame, text="Cancel", command=self.hide_load_dialog, **{
+			'font': 'Arial10Bold', 'bg': self.colors['button_normal'], 
 			'fg': self.colors['fg'], 'width': 8
 		}).pack(side='left', padx=5)
-
-
-	def sync_track_states_after_load(self):
-		"""Synchronize track states after loading project"""
-		for track_num in range(1, 9):
-			track = self.track_manager.get_track(track_num)
-			if not track:
-				continue
+		
+		self._load_dialog = dialog
+		self._load_listbox = listbox
+		
+	def hide_load_dialog(self):
+		"""Hide the Load Project dialog for the next open"""
+		self._load_dialog.grab_release()
+		self._load_dialog.withdraw()
+		
+	def load_selected_project(self):
+		"""Load the project selected in the Load Project dialog"""
+		selection = self._load_listbox.curselection()
+		if selection:
+			selected_project_data = self._load_projects[selection[0]]
 			
-			# Check if audio engine has data for this track
-			has_audio_data = self.audio_engine.has_track_data(track_num)
-			track.set_has_data(has_audio_data)
+			# Load project metadata first
+			if self.project_manager.load_project(selected_project_data['file']):
+				# Load actual audio files first
+				self.audio_engine.load_project_audio_files(selected_project_data['name'])
+				
+				# Then apply project settings to managers
+				self.project_manager.apply_project_to_managers(self.track_manager, self.audio_engine)
+				
+				# Sync track states - make sure track manager knows which tracks have data
+				for track_num in range(1, 9):
+					track = self.track_manager.get_track(track_num)
+					if track:
+						has_audio_data = self.audio_engine.has_track_data(track_num)
+						track.set_has_data(has_audio_data)
+						if has_audio_data:
+							log.debug("Track %d has audio data and is %s", track_num, 'muted' if track.is_muted else 'unmuted')
+				
+				# Update recordings directory
+				recordings_folder = self.project_manager.set_project_name(selected_project_data['name'])
+				self.audio_engine.set_recordings_directory(recordings_folder)
 		
-			# Force UI state update by clearing cache
-			state_key = f'track_{track_num}_state'
-			if state_key in self._last_update_state:
-				del self._last_update_state[state_key]
+				# Update UI
+				self.project_name_display.config(text=selected_project_data['name'])
 		
-			print(f"Track {track_num}: has_data={has_audio_data}, muted={track.is_muted}, name='{track.name}'")
-	
+				self.bpm_var.set(str(self.audio_engine.bpm))
+
+				# Update metronome button state
+				if self.audio_engine.metronome_enabled:
+					self.metronome_button.config(text="ON", bg=self.colors['button_playing'])
+				else:
+					self.metronome_button.config(text="OFF", bg=self.colors['button_normal'])
+		
+				# Update volume fader labels and values
+				self.update_track_name_labels()
+				for track_num in range(1, 9):
+					track = self.track_manager.get_track(track_num)
+					if track and track_num in self.volume_faders:
+						# Set fader to saved volume
+						self.volume_faders[track_num].set(int(track.volume * 100))
+		
+				# Update FX button states
+				for track_num in range(1, 9):
+					fx_type = self.audio_engine.get_track_fx(track_num)
+					if track_num in self.fx_buttons:
+						fx_button = self.fx_buttons[track_num]
+						if fx_type == "none":
+							fx_button.config(bg=self.colors['fx_button'])
+						else:
+							fx_button.config(bg=self.colors['fx_active'])
+		
+				# Track strips (names, buttons, status, waveforms) are reconciled on the next UI tick -
+				# cached waveform images stay valid for any track whose audio version didn't change
+				for track_num in range(1, 9):
+					self.invalidate_track_ui(track_num)
+		
+				messagebox.showinfo("Project Loaded", f"Project '{selected_project_data['name']}' loaded successfully!")
+				self.hide_load_dialog()
+			else:
+				messagebox.showerror("Load Error", "Failed to load project.")
+
+
 	def sync_track_states_after_load(self):
 		"""Synchronize track states after loading project"""
 		for track_num in range(1, 9):
@@ -1360,20 +1506,27 @@ class MultitrackUI:
 			track.set_has_data(has_audio_data)
 		
 			# Force UI state update by clearing cache
-			state_key = f'track_{track_num}_state'
-			if state_key in self._last_update_state:
-				del self._last_update_state[state_key]
+			self.invalidate_track_ui(track_num)
 		
-			print(f"Track {track_num}: has_data={has_audio_data}, muted={track.is_muted}, name='{track.name}'")
+			log.debug("Track %d: has_data=%s, muted=%s, name=%r", track_num, has_audio_data, track.is_muted, track.name)
 
+	def invalidate_track_ui(self, track_num):
+		"""Make the next update redraw every part of a track strip"""
+		self._track_ui_states[track_num] = -1
+		self._track_ui_names[track_num] = None
+		self._dirty_tracks.add(track_num)
+		
 	def clear_ui_caches(self):
 		"""Clear all UI caches for performance optimization"""
-		self._level_cache.clear()
-		self._cursor_cache.clear()
-		self._waveform_cache.clear()
-		self._segment_cache.clear()
-		self._last_update_state.clear()
-		print("✓ UI caches cleared")
+		self._drawn_segments[:] = -1
+		self._cursor_x[:] = [-999.0] * 9
+		self._waveform_versions[:] = [None] * 9
+		self._track_ui_states[:] = [-1] * 9
+		self._track_ui_names[:] = [None] * 9
+		self._dirty_tracks.update(range(1, 9))
+		self._last_time_text = None
+		self._pending_waveforms.clear()
+		log.debug("UI caches cleared")
 		
 	def stop_all(self):
 		"""Stop both playback and recording, disarm all tracks"""
@@ -1386,9 +1539,6 @@ class MultitrackUI:
 			armed_track = self.track_manager.get_armed_track()
 			if armed_track and filename:
 				self.track_manager.mark_track_has_data(armed_track, True)
-				# Clear waveform cache to force redraw
-				cache_key = f'waveform_{armed_track}'
-				self._waveform_cache.discard(cache_key)
 		
 		# Stop playback
 		self.audio_engine.stop_playback()
@@ -1400,52 +1550,25 @@ class MultitrackUI:
 		
 		# Clear all waveform cursors
 		for track_num in range(1, 9):
-			widgets = self.track_widgets.get(track_num)
+			widgets = self.track_widgets[track_num]
 			if widgets:
-				widgets['waveform_canvas'].delete('cursor')
+				widgets['waveform_canvas'].coords(widgets['cursor_id'], -5, 0, -5, 35)
 		
 		# Clear cursor cache
-		self._cursor_cache.clear()
+		self._cursor_x[:] = [-999.0] * 9
 	
-	def draw_level_meter_optimized(self, canvas, level):
-		"""Optimized level meter - only update changed segments"""
-		width = 50
-		height = 20
-		num_segments = 8
-		segment_width = (width - 2) / num_segments
-		segment_height = height - 4
-		
-		scaled_level = min(1.0, level / 0.95)
-		active_segments = int(scaled_level * num_segments)
-		
-		# Check if we need to redraw (cache the last active segment count)
-		cache_key = f'segments_{id(canvas)}'
-		last_active = self._segment_cache.get(cache_key, -1)
-		if last_active == active_segments:
-			return  # No change needed
-		
-		self._segment_cache[cache_key] = active_segments
-		
-		# Only clear and redraw if segments changed
-		canvas.delete("all")
-		
-		for i in range(num_segments):
-			x1 = 1 + i * segment_width
-			x2 = x1 + segment_width - 1
-			y1 = 2
-			y2 = y1 + segment_height
-			
-			if i < active_segments:
-				if i < num_segments * 0.7:
-					color = '#00ff00'
-				elif i < num_segments * 0.9:
-					color = '#ffff00'
-				else:
-					color = '#ff0000'
-			else:
-				color = '#333333'
-				
-			canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='#666666')
+	def draw_level_meter_optimized(self, level_commands, last_active, active_segments, script):
+		"""Optimized level meter - append Tcl recolors for the changed segments to script (last_active -1 = all)"""
+		lit_commands, unlit_commands = level_commands
+		
+		# Only the segments between the old and new level change state
+		if last_active < 0:
+			start, stop = 0, len(lit_commands)
+		else:
+			start, stop = min(last_active, active_segments), max(last_active, active_segments)
+		
+		script.extend(lit_commands[start:min(stop, active_segments)])
+		script.extend(unlit_commands[max(start, active_segments):stop])
 			
 	def draw_peak_indicator(self, peak_label, peak_active):
 		"""Update peak indicator label"""
@@ -1455,20 +1578,18 @@ class MultitrackUI:
 			peak_label.config(fg='#333333', bg='#2F4F4F')  # Dark gray with dark teal background
 			
 	def draw_waveform_cached(self, canvas, track_num):
-		"""Draw waveform with better caching"""
-		cache_key = f'waveform_{track_num}'
-		
-		# Check if we already have this waveform cached
-		if cache_key in self._waveform_cache:
+		"""Draw waveform unless the canvas already shows this version of the track's audio"""
+		version = self.audio_engine.track_data_versions[track_num]
+		if self._waveform_versions[track_num] == version:
 			return  # Already drawn
 		
 		# Draw the waveform
 		self.draw_waveform(canvas, track_num)
-		self._waveform_cache.add(cache_key)
+		self._waveform_versions[track_num] = version
 		
 	def draw_waveform(self, canvas, track_num):
-		"""Draw waveform for a track"""
-		canvas.delete("all")
+		"""Draw waveform for a track - everything but the playback cursor is tagged 'wave'"""
+		canvas.delete('wave')
 		
 		# Check if track has data
 		if not self.audio_engine.has_track_data(track_num):
@@ -1477,68 +1598,63 @@ class MultitrackUI:
 				150, 17,  # Center of 300x35 canvas
 				text="No Recording",
 				fill='#666666',
-				font=('Arial', 10)
+				font='Arial10',
+				tags='wave'
 			)
 			return
 		
-		# Get track data
-		track_data = self.audio_engine.track_data.get(track_num)
-		if track_data is None or len(track_data) == 0:
-			return
+		# Blit the cached image, or have the pool build it - the canvas is redrawn when it lands
+		key = (self.audio_engine.track_data_versions[track_num], 300, 35, canvas.cget('bg'))
+		cached = self._waveform_images[track_num]
+		if cached is not None and cached[0] == key:
+			canvas.create_image(0, 0, image=cached[1], anchor='nw', tags='wave')
+			canvas.tag_lower('wave')  # Keep the cursor on top
+		elif self._waveform_jobs[track_num] != key:
+			self._waveform_jobs[track_num] = key
+			self._waveform_pool.submit(self._build_waveform_job, track_num, key)
 			
-		canvas_width = 300
-		canvas_height = 35
-		
-		# Downsample audio data for display
-		samples_per_pixel = max(1, len(track_data) // canvas_width)
-		downsampled = []
-		
-		for i in range(0, len(track_data), samples_per_pixel):
-			chunk = track_data[i:i + samples_per_pixel]
-			if len(chunk) > 0:
-				# Use RMS for better visual representation
-				rms = np.sqrt(np.mean(chunk ** 2))
-				downsampled.append(rms)
-		
-		if len(downsampled) == 0:
+	def _build_waveform_job(self, track_num, key):
+		"""Waveform pool worker - queues the image data back to the Tk thread"""
+		try:
+			# Use RMS for better visual representation - the engine reduces its own storage format
+			envelope = self.audio_engine.get_track_envelope(track_num, key[1])
+			data = None
+			if envelope is not None:
+				data = build_waveform_image_data(envelope, key[1], key[2], key[3])
+		except Exception as e:
+			print(f"Waveform render error: {e}")
+			data = None
+		self.audio_engine.ui_queue.put(('waveform', (track_num, key, data)))
+		
+	def _finish_waveform(self, track_num, key, data):
+		"""Turn a finished waveform into a PhotoImage and show it - Tk thread only"""
+		if self._waveform_jobs[track_num] == key:
+			self._waveform_jobs[track_num] = None
+		# A newer recording or clear since the job started makes this result stale
+		if data is None or key[0] != self.audio_engine.track_data_versions[track_num]:
 			return
 			
-		# Normalize to canvas height
-		max_level = max(downsampled) if max(downsampled) > 0 else 1
-		center_y = canvas_height // 2
-		
-		# Draw waveform
-		for i, level in enumerate(downsampled):
-			x = (i * canvas_width) // len(downsampled)
-			y_offset = (level / max_level) * (center_y - 2)
-			
-			# Draw vertical line for waveform
-			canvas.create_line(
-				x, center_y - y_offset, 
-				x, center_y + y_offset, 
-				fill='#00ff88', 
-				width=1
-			)
+		photo = tk.PhotoImage(width=key[1], height=key[2])
+		photo.put(data)
+		self._waveform_images[track_num] = (key, photo)  # Holding the reference keeps Tk from dropping the image
+		
+		widgets = self.track_widgets[track_num]
+		if widgets:
+			self.draw_waveform(widgets['waveform_canvas'], track_num)
 				
 	def update_waveform_cursor_optimized(self, track_num, widgets):
 		"""Update waveform cursor - only if position changed significantly"""
-		track_length = self.audio_engine.track_lengths.get(track_num, 0)
-		if track_length == 0:
+		scale = self._cursor_scales[track_num]
+		if scale == 0.0:
 			return
 		
-		position = self.audio_engine.playback_position
-		canvas_width = 300
-		cursor_x = (position / track_length) * canvas_width
+		cursor_x = self.audio_engine.playback_position * scale
 		
 		# Only update cursor if moved by at least 2 pixels
-		cache_key = f'cursor_{track_num}'
-		last_x = self._cursor_cache.get(cache_key, -999)
-		if abs(cursor_x - last_x) > 2:  # Only update if moved significantly
-			self._cursor_cache[cache_key] = cursor_x
+		if abs(cursor_x - self._cursor_x[track_num]) > 2:  # Only update if moved significantly
+			self._cursor_x[track_num] = cursor_x
 			
-			canvas = widgets['waveform_canvas']
-			canvas.delete('cursor')
-			canvas.create_line(cursor_x, 0, cursor_x, 35, fill='#ffffff', width=2, tags='cursor')
+			widgets['waveform_canvas'].coords(widgets['cursor_id'], cursor_x, 0, cursor_x, 35)
 				
 	def start_playback(self):
 		"""Start playback - start recording if track is armed"""
@@ -1588,13 +1704,8 @@ class MultitrackUI:
 				self.track_manager.clear_track(track_num)
 				self.audio_engine.clear_track(track_num)
 				
-				# Clear caches for this track
-				cache_key = f'waveform_{track_num}'
-				self._waveform_cache.discard(cache_key)
-				
-				state_key = f'track_{track_num}_state'
-				if state_key in self._last_update_state:
-					del self._last_update_state[state_key]
+				# Clear caches for this track - the waveform follows the engine's data version by itself
+				self.invalidate_track_ui(track_num)
 				
 	def toggle_metronome(self):
 		"""Toggle metronome on/off"""
@@ -1610,47 +1721,92 @@ class MultitrackUI:
 		volume = int(value) / 100.0  # Convert to 0.0-1.0 range
 		self.audio_engine.set_metronome_volume(volume)
 	
-	def start_optimized_ui_update_thread(self):
-		"""Start OPTIMIZED background threads for UI updates"""
-		
-		# Main UI update thread (10Hz) - for buttons, status, waveforms, cursors
-		def main_update_loop():
-			frame_count = 0
-			
+	def start_ui_update_loop(self):
+		"""Start the UI refresh - one Tk timer drains queued events and redraws at most ~30 times a second"""
+		self._ui_queue = self.audio_engine.ui_queue
+		self._ui_frame_count = 0
+		self._data_tracks = ()  # Tracks with audio, rebuilt only when track state changes
+		self._data_tracks_version = None  # track_manager._state_version _data_tracks was built from
+		self.root.after_idle(self._ui_tick)
+		
+	def post_to_ui(self, callback):
+		"""Run callback on the Tk thread at the next UI tick - safe to call from any thread"""
+		self._ui_queue.put(('call', callback))
+		
+	def _ui_tick(self):
+		"""One UI frame: handle queued events, redraw meters, refresh the track strips that changed"""
+		try:
+			# Bursts of events between frames collapse into one pass here
+			changed_tracks = self._dirty_tracks
+			self._dirty_tracks = set()
+			changed_tracks |= self.track_manager.take_dirty_tracks()
 			while True:
 				try:
-					frame_count += 1
-					# Stagger track updates - only update 2 tracks per frame for 8 total tracks
-					tracks_to_update = [(frame_count % 4) * 2 + i + 1 for i in range(2)]
-					
-					self.root.after(0, lambda ttu=tracks_to_update: self.update_ui_optimized(ttu))
-					time.sleep(0.1)  # 10Hz - for main UI elements
-				except:
+					kind, payload = self._ui_queue.get_nowait()
+				except queue.Empty:
 					break
+				if kind == 'call':
+					payload()
+				elif kind == 'track_data':
+					changed_tracks.add(payload)
+				elif kind == 'latency':
+					self.update_latency_info(payload)
+				elif kind == 'waveform':
+					self._finish_waveform(*payload)
+			
+			# Starting or stopping transport changes every strip's status text
+			transport = (self.is_playing, self.is_recording)
+			if transport != self._last_transport:
+				self._last_transport = transport
+				changed_tracks.update(range(1, 9))
+			
+			for track_num in changed_tracks:
+				self.update_track_ui_optimized(track_num)
+			
+			# Level meters every frame (~30Hz)
+			self.update_all_level_meters()
+			
+			# Time, deferred waveforms and cursors every third frame (~10Hz) - nothing to do when idle
+			self._ui_frame_count += 1
+			if self._ui_frame_count % 3 == 0:
+				if self.is_playing:
+					# Pending waveforms only ever belong to tracks with data
+					self.update_ui_optimized(self.get_data_tracks())
+				elif self._pending_waveforms:
+					self.update_ui_optimized(tuple(self._pending_waveforms))
+		except Exception as e:
+			print(f"UI update error: {e}")
 		
-		# Level meter update thread (20Hz) - faster updates for level meters only
-		def level_meter_update_loop():
-			while True:
-				try:
-					self.root.after(0, self.update_all_level_meters)
-					time.sleep(0.05)  # 20Hz - 2x faster for level meters
-				except:
-					break
-					
-		# Start both threads
-		main_thread = threading.Thread(target=main_update_loop, daemon=True)
-		level_thread = threading.Thread(target=level_meter_update_loop, daemon=True)
+		self.root.after(33, self._ui_tick)
 		
-		main_thread.start()
-		level_thread.start()
+	def get_data_tracks(self):
+		"""Tuple of tracks with audio - reused until a mute/arm/data change"""
+		version = self.track_manager._state_version
+		if version != self._data_tracks_version:
+			self._data_tracks_version = version
+			self._data_tracks = tuple(self.track_manager.get_tracks_with_data())
+		return self._data_tracks
 	
 	def update_all_level_meters(self):
-		"""Update all level meters at 20Hz for responsive feedback"""
+		"""Update all level meters once per UI frame for responsive feedback"""
 		try:
-			for track_num in range(1, 9):
-				widgets = self.track_widgets.get(track_num)
+			# One snapshot of the engine's meter arrays per redraw
+			levels = self.audio_engine.get_all_levels()
+			peaks = self.audio_engine.get_all_peaks()
+			
+			# Key on what's actually drawn - only meters whose lit count or peak changed are touched
+			segments = (np.minimum(levels * (1 / 0.95), 1.0) * len(self.SEGMENT_COLORS)).astype(np.int64)
+			changed = np.flatnonzero((segments != self._drawn_segments) | (peaks != self._drawn_peaks))
+			
+			script = []
+			for track_num in changed.tolist():
+				widgets = self.track_widgets[track_num]
 				if widgets:
-					self.update_level_meter_optimized(track_num, widgets)
+					self.update_level_meter_optimized(track_num, widgets, int(segments[track_num]), bool(peaks[track_num]), script)
+			
+			# All meters' segment changes go to Tcl in one call rather than one itemconfigure each
+			if script:
+				self.root.tk.eval('\n'.join(script))
 		except Exception as e:
 			pass  # Silently handle any errors in level meter updates
 		
@@ -1661,123 +1817,133 @@ class MultitrackUI:
 			if self.is_playing:
 				playback_time = self.audio_engine.get_playback_time()
 				time_str = self.format_time_with_ms(playback_time)
-				self.time_label.config(text=time_str)
+				if self._last_time_text != time_str:
+					self._last_time_text = time_str
+					self.time_label.config(text=time_str)
 			
-			# Update only specific tracks this frame
+			# Update only tracks with a waveform or cursor still to draw
 			for track_num in tracks_to_update:
-				if track_num <= 8:
-					self.update_track_ui_optimized(track_num)
+				self.update_track_ui_optimized(track_num)
 					
 		except Exception as e:
 			print(f"UI update error: {e}")
 			
 	def format_time_with_ms(self, seconds):
 		"""Format time as MM:SS.mmm"""
-		minutes = int(seconds // 60)
-		secs = int(seconds % 60)
-		milliseconds = int((seconds % 1) * 1000)
+		whole_seconds, milliseconds = divmod(int(seconds * 1000), 1000)
+		if 0 <= whole_seconds < len(TIME_PREFIX_TABLE):
+			return TIME_PREFIX_TABLE[whole_seconds] + f"{milliseconds:03d}"
+		minutes, milliseconds = divmod(int(seconds * 1000), 60000)
+		secs, milliseconds = divmod(milliseconds, 1000)
 		return f"{minutes:02d}:{secs:02d}.{milliseconds:03d}"
 		
 	def update_track_ui_optimized(self, track_num):
 		"""OPTIMIZED track UI update - only what changed"""
 		track = self.track_manager.get_track(track_num)
-		widgets = self.track_widgets.get(track_num)
+		widgets = self.track_widgets[track_num]
 		
 		if not track or not widgets:
 			return
 		
-		# Create state hash to detect changes
+		# Pack the strip state into one int - the audio version changes when the audio is replaced
 		current_state = (
-			track.name,
-			track.is_armed,
-			track.is_muted,
-			track.has_data,
-			self.is_playing,
-			self.is_recording
+			self.audio_engine.track_data_versions[track_num] << STATE_VERSION_SHIFT
+			| (STATE_ARMED if track.is_armed else 0)
+			| (STATE_MUTED if track.is_muted else 0)
+			| (STATE_HAS_DATA if track.has_data else 0)
+			| (STATE_PLAYING if self.is_playing else 0)
+			| (STATE_RECORDING if self.is_recording else 0)
 		)
 		
-		state_key = f'track_{track_num}_state'
-		last_state = self._last_update_state.get(state_key)
+		last_state = self._track_ui_states[track_num]
 		
 		# Only update if state changed
-		if last_state != current_state:
-			self._last_update_state[state_key] = current_state
+		if last_state != current_state or self._track_ui_names[track_num] != track.name:
+			self._track_ui_states[track_num] = current_state
+			changed = last_state ^ current_state if last_state >= 0 else -1  # -1: every field changed
 			
 			# Update track name entry only if changed
-			if last_state is None or last_state[0] != track.name:
+			if self._track_ui_names[track_num] != track.name:
+				self._track_ui_names[track_num] = track.name
 				widgets['track_name_var'].set(track.name)
 			
 			# Update ARM button only if state changed
-			if last_state is None or last_state[1] != track.is_armed or last_state[3] != track.has_data:
+			if changed & (STATE_ARMED | STATE_HAS_DATA):
 				if track.has_data:
 					widgets['arm_button'].config(
-						bg=self.colors['button_disabled'],
+						bg=BG_DISABLED,
 						fg='#888888',
 						text="DISABLED",
 						state='disabled'
 					)
 				else:
-					widgets['arm_button'].config(state='normal', fg=self.colors['fg'])
 					if track.is_armed:
-						widgets['arm_button'].config(bg=self.colors['button_armed'], text="ARMED")
+						widgets['arm_button'].config(state='normal', fg=FG_TEXT, bg=BG_ARMED, text="ARMED")
 					else:
-						widgets['arm_button'].config(bg=self.colors['button_normal'], text="ARM")
+						widgets['arm_button'].config(state='normal', fg=FG_TEXT, bg=BG_NORMAL, text="ARM")
 			
 			# Update MUTE button only if changed
-			if last_state is None or last_state[2] != track.is_muted:
-				color = self.colors['button_muted'] if track.is_muted else self.colors['button_normal']
-				widgets['mute_button'].config(bg=color)
+			if changed & STATE_MUTED:
+				widgets['mute_button'].config(bg=BG_MUTED if track.is_muted else BG_NORMAL)
 			
 			# Update waveform only if track data changed
-			if last_state is None or last_state[3] != track.has_data:
+			if changed & STATE_HAS_DATA or changed >> STATE_VERSION_SHIFT:
+				track_length = int(self.audio_engine.track_lengths[track_num])
+				self._cursor_scales[track_num] = 300.0 / track_length if track_length else 0.0
 				if track.has_data:
-					self.draw_waveform_cached(widgets['waveform_canvas'], track_num)
+					self._waveform_versions[track_num] = None
+					self._pending_waveforms.add(track_num)
 				else:
-					widgets['waveform_canvas'].delete("all")
+					self._pending_waveforms.discard(track_num)
+					widgets['waveform_canvas'].delete('wave')
 					widgets['waveform_canvas'].create_text(
-						150, 17, text="No Recording", fill='#666666', font=('Arial', 10)
+						150, 17, text="No Recording", fill='#666666', font='Arial10', tags='wave'
 					)
 			
 			# Update status label only if state changed
 			status_text = self.get_status_from_state(current_state)
-			if last_state is None or self.get_status_from_state(last_state) != status_text:
+			if last_state < 0 or self.get_status_from_state(last_state) != status_text:
 				widgets['status_label'].config(text=status_text)
 		
 		# Always update level meters and cursors (but optimize them)
-		# Note: Level meters now updated by separate 20Hz thread
+		# Note: Level meters are updated every frame by _ui_tick
+		
+		# Redraw a changed waveform once its rate-limit slot comes round
+		if track_num in self._pending_waveforms:
+			now = time.monotonic()
+			if now >= self._next_waveform_redraw[track_num]:
+				self._next_waveform_redraw[track_num] = now + 1.0 / self.WAVEFORM_HZ
+				self._pending_waveforms.discard(track_num)
+				self.draw_waveform_cached(widgets['waveform_canvas'], track_num)
 		
 		# Update cursors only during playback and only for tracks with data
 		if self.is_playing and track.has_data:
 			self.update_waveform_cursor_optimized(track_num, widgets)
 	
 	def get_status_from_state(self, state):
-		"""Helper to get status text from state tuple"""
-		name, is_armed, is_muted, has_data, is_playing, is_recording = state
+		"""Helper to get status text from packed state bits"""
+		has_data = state & STATE_HAS_DATA
 		status_text = "Recorded" if has_data else "Empty"
-		if is_muted and has_data:
+		if state & STATE_MUTED and has_data:
 			status_text += " (Muted)"
-		elif is_armed and not has_data:
-			status_text += " (Recording)" if is_recording else " (Armed)"
+		elif state & STATE_ARMED and not has_data:
+			status_text += " (Recording)" if state & STATE_RECORDING else " (Armed)"
 		return status_text
 	
-	def update_level_meter_optimized(self, track_num, widgets):
-		"""Update level meter only if level changed significantly"""
-		level = self.audio_engine.get_track_level(track_num)
-		peak = self.audio_engine.get_track_peak(track_num)
-		
-		# Check if we have cached level info
-		cache_key = f'level_{track_num}'
-		cached_level = self._level_cache.get(cache_key, -1)
-		
-		# Only redraw if level changed by more than 5% or peak state changed
-		peak_cache_key = f'peak_{track_num}'
-		cached_peak = self._level_cache.get(peak_cache_key, not peak)
-		
-		if abs(level - cached_level) > 0.05 or peak != cached_peak:
-			self._level_cache[cache_key] = level
-			self._level_cache[peak_cache_key] = peak
-			
-			self.draw_level_meter_optimized(widgets['level_canvas'], level)
+	def update_level_meter_optimized(self, track_num, widgets, active_segments, peak, script):
+		"""Redraw a meter whose lit segments or peak state changed - segment recolors go into script"""
+		now = time.monotonic()
+		if now < self._next_level_redraw[track_num]:
+			return
+		self._next_level_redraw[track_num] = now + 1.0 / self.LEVEL_HZ
+		
+		last_active = int(self._drawn_segments[track_num])
+		first_draw = last_active < 0
+		if last_active != active_segments:
+			self._drawn_segments[track_num] = active_segments
+			self.draw_level_meter_optimized(widgets['level_commands'], last_active, active_segments, script)
+		if first_draw or self._drawn_peaks[track_num] != peak:
+			self._drawn_peaks[track_num] = peak
 			self.draw_peak_indicator(widgets['peak_indicator'], peak)
 
 	def setup_focus_handling(self):